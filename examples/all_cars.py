@@ -24,12 +24,24 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import argparse
+import asyncio
 import json
 import os
 import tempfile
 import logging
+import queue
+
+from logging.handlers import QueueHandler, QueueListener
 
 from carconnectivity import carconnectivity
+from carconnectivity.errors import RetrievalError, MultipleRetrievalError
+
+SUPPORT_ORJSON = False  # pylint: disable=invalid-name
+try:
+    import orjson
+    SUPPORT_ORJSON = True  # pylint: disable=invalid-name
+except ImportError:
+    pass
 
 if TYPE_CHECKING:
     from typing import List, Optional
@@ -42,6 +54,36 @@ DEFAULT_LOG_LEVEL = "ERROR"
 LOG: logging.Logger = logging.getLogger("carconnectivity-example")
 
 
+async def fetch_all(car_connectivity: carconnectivity.CarConnectivity) -> None:
+    """
+    Fetch data from all connectors concurrently.
+
+    The connectors are blocking, so every connector fetches in its own worker thread and the
+    requests to the different services overlap instead of running one after the other.
+
+    Raises:
+        RetrievalError: If any connector raises a RetrievalError during data fetching.
+        If multiple connectors raise a RetrievalError, a MultipleRetrievalError containing all errors is raised.
+    """
+    results = await asyncio.gather(*[asyncio.to_thread(connector.fetch_all) for connector in car_connectivity.connectors.connectors.values()],
+                                   return_exceptions=True)
+    retrieval_error: Optional[RetrievalError] = None
+    for result in results:
+        if isinstance(result, RetrievalError):
+            if retrieval_error is None:
+                retrieval_error = result
+            elif isinstance(retrieval_error, MultipleRetrievalError):
+                retrieval_error.errors.add(result)
+            else:
+                new_retrieval_error = MultipleRetrievalError(retrieval_error)
+                new_retrieval_error.errors.add(result)
+                retrieval_error = new_retrieval_error
+        elif isinstance(result, BaseException):
+            raise result
+    if retrieval_error is not None:
+        raise retrieval_error
+
+
 #  pylint: disable=duplicate-code
 def main() -> None:
     """ Simple example showing how to retrieve all vehicles from the account """
@@ -62,30 +104,43 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    log_level: int = LOG_LEVELS.index(DEFAULT_LOG_LEVEL)
-    for adjustment in args.verbose or ():
-        log_level = min(len(LOG_LEVELS) - 1, max(log_level + adjustment, 0))
-
-    logging.basicConfig(level=LOG_LEVELS[log_level], format=args.logging_format, datefmt=args.logging_date_format)
-
-    print('#  read CarConnectivity configuration')
-    with open(args.config, 'r', encoding='utf-8') as config_file:
-        config_dict = json.load(config_file)
-        print('#  Login')
-        car_connectivity = carconnectivity.CarConnectivity(config=config_dict, tokenstore_file=args.tokenstorefile)
-        car_connectivity.startup()
-        print('#  fetch data')
-        car_connectivity.fetch_all()
-        print('#  getData')
-        garage: Optional[Garage] = car_connectivity.get_garage()
-        if garage is not None:
-            print('#  list all vehicles')
-            for vehicle in garage.list_vehicles():
-                print(f'#  {vehicle}')
-        print('#  Shutdown')
-        car_connectivity.shutdown()
-
-    print('#  done')
+    # All adjustments move into the same direction, so clamping the sum is the same as clamping after each step
+    log_level: int = max(0, min(len(LOG_LEVELS) - 1, LOG_LEVELS.index(DEFAULT_LOG_LEVEL) + sum(args.verbose or ())))
+
+    # Log records are only put into a queue by the logging calls, writing them out happens in the thread of the listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler: logging.StreamHandler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt=args.logging_format, datefmt=args.logging_date_format))
+    log_listener: QueueListener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    log_listener.start()
+    logging.basicConfig(level=LOG_LEVELS[log_level], handlers=[QueueHandler(log_queue)])
+
+    try:
+        print('#  read CarConnectivity configuration')
+        with open(args.config, 'rb') as config_file:
+            # orjson parses the raw bytes directly, json.loads detects the utf-8 encoding of bytes itself
+            if SUPPORT_ORJSON:
+                config_dict = orjson.loads(config_file.read())
+            else:
+                config_dict = json.loads(config_file.read())
+            print('#  Login')
+            car_connectivity = carconnectivity.CarConnectivity(config=config_dict, tokenstore_file=args.tokenstorefile)
+            car_connectivity.startup()
+            print('#  fetch data')
+            asyncio.run(fetch_all(car_connectivity))
+            print('#  getData')
+            garage: Optional[Garage] = car_connectivity.get_garage()
+            if garage is not None:
+                print('#  list all vehicles')
+                for vehicle in garage.list_vehicles():
+                    print(f'#  {vehicle}')
+            print('#  Shutdown')
+            car_connectivity.shutdown()
+
+        print('#  done')
+    finally:
+        # Flushes all remaining log records
+        log_listener.stop()
 
 
 if __name__ == '__main__':
@@ -67,9 +67,8 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    log_level: int = LOG_LEVELS.index(DEFAULT_LOG_LEVEL)
-    for adjustment in args.verbose or ():
-        log_level = min(len(LOG_LEVELS) - 1, max(log_level + adjustment, 0))
+    # All adjustments move into the same direction, so clamping the sum is the same as clamping after each step
+    log_level: int = max(0, min(len(LOG_LEVELS) - 1, LOG_LEVELS.index(DEFAULT_LOG_LEVEL) + sum(args.verbose or ())))
 
     logging.basicConfig(level=LOG_LEVELS[log_level], format=args.logging_format, datefmt=args.logging_date_format)
 
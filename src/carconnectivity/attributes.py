@@ -2,15 +2,16 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, TypeVar, Generic, Optional
 
+import sys
 import logging
-import json
+import heapq
+
+from operator import itemgetter, add, sub, mul, truediv
 
 from enum import Enum
 
 from datetime import datetime, timezone, timedelta
 
-from pytimeparse import parse
-
 from carconnectivity.errors import ConfigurationError
 from carconnectivity.units import GenericUnit, Length, Level, Temperature, Speed, Power, Current, Energy, EnergyConsumption, FuelConsumption, Volume
 from carconnectivity.observable import Observable
@@ -34,9 +35,11 @@ except ImportError:
 # pylint: enable=duplicate-code
 
 if TYPE_CHECKING:
-    from typing import Any, Union, List, Literal, Callable, Tuple, Set, Self, Type, Dict
+    from typing import Any, Union, List, Literal, Callable, Tuple, Set, FrozenSet, Self, Type, Dict
     from carconnectivity.objects import GenericObject
 
+    ConversionSteps = Tuple[Tuple[Callable[[Any, Any], Any], Any], ...]
+
 
 T = TypeVar('T')
 U = TypeVar('U', bound=Optional[GenericUnit])
@@ -44,6 +47,103 @@ U = TypeVar('U', bound=Optional[GenericUnit])
 
 LOG: logging.Logger = logging.getLogger("carconnectivity")
 
+_UTC: timezone = timezone.utc
+
+# Encoders are stateless, so one instance per indentation is shared by all attributes
+_JSON_ENCODER_PRETTY: ExtendedWithNullEncoder = ExtendedWithNullEncoder(skipkeys=True, indent=4)
+_JSON_ENCODER: ExtendedWithNullEncoder = ExtendedWithNullEncoder(skipkeys=True, indent=0)
+
+# Lowercase strings that are accepted as boolean values
+_TRUE_STRINGS: FrozenSet[str] = frozenset(('true', 'yes', '1', 'on'))
+_FALSE_STRINGS: FrozenSet[str] = frozenset(('false', 'no', '0', 'off'))
+
+# Event flags raised by _set_value as plain integers. Combining integers is much cheaper than combining Flag members,
+# the result is converted to an ObserverEvent only once per update
+_EVENT_UPDATED: int = Observable.ObserverEvent.UPDATED.value
+_EVENT_UPDATED_NEW_MEASUREMENT: int = Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT.value
+_EVENT_VALUE_CHANGED: int = Observable.ObserverEvent.VALUE_CHANGED.value
+
+
+def _convert_to_bool(value: Any) -> bool:
+    """
+    Convert a value to bool, used by type_conversion of bool attributes.
+
+    Args:
+        value (Any): The value to convert, must not be None.
+
+    Returns:
+        bool: The converted value.
+    """
+    if isinstance(value, bool):
+        return value
+    LOG.debug('Implicitly converting value to bool: %s', value)
+    if isinstance(value, str):
+        lowered: str = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError('Not a value that can be interpreted as valid boolean value (True/False)')
+    if isinstance(value, (float, int)):
+        if value == 0:
+            return False
+        return True
+    return bool(value)
+
+
+def _convert_to_float(value: Any) -> float:
+    """
+    Convert a value to float, used by type_conversion of float attributes.
+
+    Args:
+        value (Any): The value to convert, must not be None.
+
+    Returns:
+        float: The converted value.
+    """
+    if isinstance(value, float):
+        return value
+    LOG.debug('Implicitly converting value to float: %s', value)
+    return float(value)
+
+
+def _convert_to_timedelta(value: Any) -> timedelta:
+    """
+    Convert a value to timedelta, used by type_conversion of timedelta attributes.
+
+    Strings are interpreted as seconds or as a duration like '1h 30m', numbers as seconds.
+
+    Args:
+        value (Any): The value to convert, must not be None.
+
+    Returns:
+        timedelta: The converted value.
+    """
+    if isinstance(value, timedelta):
+        return value
+    LOG.debug('Implicitly converting value to timedelta: %s', value)
+    if isinstance(value, str):
+        try:
+            try:
+                return timedelta(seconds=float(value))
+            except ValueError:
+                # pytimeparse is only needed for durations given as text, so it is imported on first use
+                from pytimeparse import parse  # pylint: disable=import-outside-toplevel
+                return timedelta(seconds=parse(value))
+        except TypeError as err:
+            raise ValueError('Not a value that can be interpreted as valid timedelta value') from err
+    elif isinstance(value, (int, float)):
+        return timedelta(seconds=value)
+    return timedelta(value)
+
+
+# Conversion functions of the value types that are converted implicitly, all other values are taken as they are
+_TYPE_CONVERSIONS: Dict[Any, Callable[[Any], Any]] = {
+    bool: _convert_to_bool,
+    float: _convert_to_float,
+    timedelta: _convert_to_timedelta,
+}
+
 
 class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-instance-attributes, too-many-lines, too-many-public-methods
     """
@@ -60,6 +160,11 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         last_updated (Optional[datetime]): The last time the attribute value was updated in the vehicle.
         last_updated_local (Optional[datetime]): The last time the attribute value was updated in carconnectivity.
     """
+    # __weakref__ keeps attributes usable as targets of weak references (e.g. by connectors and plugins)
+    __slots__ = ('_name', 'tags', '_parent', '_value', '_value_source', '_old_value', '_value_type', '_type_conversion', '_unit', '_unit_str',
+                 '_unit_type', '_is_changeable', '_on_set_hooks_early', '_on_set_hooks_late', '_enabled', '_initialized', 'last_changed',
+                 'last_changed_local', 'last_updated', 'last_updated_local', 'value_lock', 'tags_lock', 'hooks_lock', '_absolute_path',
+                 '__weakref__')
 
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: Optional[GenericObject], value: Optional[T] = None, value_type: Optional[Type[T]] = None, unit: Optional[U] = None,
@@ -74,23 +179,32 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             unit (Optional[str], optional): The unit of the attribute value. Defaults to None.
         """
         super().__init__()
-        self.__name: str = name
+        # Names repeat for every vehicle, interning shares the strings and lets lookups by name compare by identity
+        self._name: str = sys.intern(name)
         self.tags: Set[str] = tags if tags is not None else set()
         if parent is None:
             raise ValueError('Parent object is required')
-        self.__parent: GenericObject = parent
-        self.__parent.children.append(self)
-        self.__value: Optional[T] = None
-        self.__value_source: Optional[Any] = source
-        self.__old_value: Optional[T] = None
-        self.__value_type: Optional[Type[T]] = value_type if value_type is not None else type(value) if value is not None else None
-        self.__unit: Optional[U] = unit
-        self.__unit_type: Optional[Type[U]] = type(unit) if unit is not None else None
+        self._enabled: bool = False
+        self._parent: GenericObject = parent
+        parent._add_child(self)  # pylint: disable=protected-access
+        self._absolute_path: Optional[str] = None
+        self._value: Optional[T] = None
+        self._value_source: Optional[Any] = source
+        self._old_value: Optional[T] = None
+        self._value_type: Optional[Type[T]] = value_type if value_type is not None else type(value) if value is not None else None
+        # The value type never changes, so the conversion function is looked up once. Only bool, float and timedelta attributes convert values
+        self._type_conversion: Optional[Callable[[Any], Any]] = _TYPE_CONVERSIONS.get(self._value_type)
+        self._unit: Optional[U] = unit
+        # String representation of the unit, cached as it is needed every time the attribute is converted to a string
+        self._unit_str: str = unit.value if unit is not None else ''
+        self._unit_type: Optional[Type[U]] = type(unit) if unit is not None else None
         self._is_changeable: bool = False
-        self._on_set_hooks: List[Tuple[Callable[[Self, Optional[T]], T], bool]] = []
+        # Early hooks run before, late hooks after the type conversion. The dicts are ordered like lists, but with constant time lookups
+        # and removals. The values are unused
+        self._on_set_hooks_early: Dict[Callable[[Self, Optional[T]], T], None] = {}
+        self._on_set_hooks_late: Dict[Callable[[Self, Optional[T]], T], None] = {}
 
-        self.__enabled: bool = False
-        self.__initialized: bool = False
+        self._initialized: bool = False
 
         self.last_changed: Optional[datetime] = None
         self.last_changed_local: Optional[datetime] = None
@@ -113,7 +227,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             bool: True if the attribute has been initialized, False otherwise.
         """
 
-        return self.__initialized
+        return self._initialized
 
     def initialize(self, initialization: dict[str, Any] | T, source: Optional[Any] = None) -> None:
         """
@@ -133,23 +247,23 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             - If 'uni' is provided but no unit_type is defined, a warning is logged
             - If 'upd' format is invalid, a warning is logged
             - The 'Z' timezone indicator in timestamps is automatically converted to '+00:00'
-            - Sets the __initialized flag to True after processing
+            - Sets the _initialized flag to True after processing
         """
 
         if isinstance(initialization, dict):
             if 'val' in initialization:
                 self._set_value(self.type_conversion(initialization['val']), source=source)
             else:
-                LOG.warning('No value found in initialization for attribute %s', self.__name)
+                LOG.warning('No value found in initialization for attribute %s', self._name)
             if 'uni' in initialization:
-                if self.__unit_type is not None:
+                if self._unit_type is not None:
                     try:
-                        self.__unit = self.__unit_type(initialization['uni'])
+                        self._set_unit(self._unit_type(initialization['uni']))
                     except ValueError:
-                        raise ConfigurationError(f'Invalid unit \'{initialization["uni"]}\' for attribute \'{self.__name}\'. In pre initialization'
-                                                 f'Must be one of {[x.value for x in self.__unit_type]}') from None
+                        raise ConfigurationError(f'Invalid unit \'{initialization["uni"]}\' for attribute \'{self._name}\'. In pre initialization'
+                                                 f'Must be one of {[x.value for x in self._unit_type]}') from None
                 else:
-                    LOG.warning('No unit type defined for attribute %s, cannot set unit from initialization', self.__name)
+                    LOG.warning('No unit type defined for attribute %s, cannot set unit from initialization', self._name)
             if 'upd' in initialization:
                 try:
                     upd_str: str = initialization['upd']
@@ -160,11 +274,11 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
                             upd_str = upd_str.replace('Z', '+00:00')
                     self.last_updated = datetime.fromisoformat(upd_str)
                 except ValueError:
-                    LOG.warning('Invalid date format in initialization for attribute %s: %s', self.__name, initialization['upd'])
-            self.__initialized = True
+                    LOG.warning('Invalid date format in initialization for attribute %s: %s', self._name, initialization['upd'])
+            self._initialized = True
         else:
             self._set_value(self.type_conversion(initialization), source=source)
-            self.__initialized = True
+            self._initialized = True
 
     def has_tag(self, tag: str) -> bool:
         """
@@ -216,8 +330,10 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             None
         """
         with self.hooks_lock:
-            if (hook, early_hook) not in self._on_set_hooks:
-                self._on_set_hooks.append((hook, early_hook))
+            if early_hook:
+                self._on_set_hooks_early.setdefault(hook, None)
+            else:
+                self._on_set_hooks_late.setdefault(hook, None)
 
     def _execute_on_set_hook(self, new_value: Optional[T], early_hook=False) -> Optional[T]:
         """
@@ -229,10 +345,14 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             None
         """
+        hooks: Dict[Callable[[Self, Optional[T]], T], None] = self._on_set_hooks_early if early_hook else self._on_set_hooks_late
+        # Most attributes have no hooks, they do not need to take the lock
+        if not hooks:
+            return new_value
         with self.hooks_lock:
-            for hook, early in self._on_set_hooks:
-                if early == early_hook:
-                    new_value = hook(self, new_value)
+            # Iterate over a copy, a hook may add or remove hooks
+            for hook in tuple(hooks):
+                new_value = hook(self, new_value)
             return new_value
 
     def _remove_on_set_hook(self, hook: Callable[[Self, T], T]) -> None:
@@ -246,9 +366,8 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             None
         """
         with self.hooks_lock:
-            for ihook, _ in self._on_set_hooks:
-                if ihook == hook:
-                    self._on_set_hooks.remove((ihook, _))
+            self._on_set_hooks_early.pop(hook, None)
+            self._on_set_hooks_late.pop(hook, None)
 
     def _has_on_set_hook(self, hook: Callable[[Self, T], T]) -> bool:
         """
@@ -261,10 +380,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             bool: True if the hook is present, False otherwise.
         """
         with self.hooks_lock:
-            for ihook, _ in self._on_set_hooks:
-                if ihook == hook:
-                    return True
-            return False
+            return hook in self._on_set_hooks_early or hook in self._on_set_hooks_late
 
     def get_on_set_hooks(self, early_hook=False) -> List[Callable[[Self, T], T]]:
         """
@@ -277,35 +393,31 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             List[Callable]: A list of hooks that are called when the value is set.
         """
         with self.hooks_lock:
-            return [hook for hook, early in self._on_set_hooks if early == early_hook]
-
-    def __del__(self) -> None:
-        if self.enabled:
-            self.enabled = False
+            return list(self._on_set_hooks_early if early_hook else self._on_set_hooks_late)
 
     # pylint: disable=duplicate-code
-    def get_observer_entries(self, flags: Observable.ObserverEvent, on_transaction_end: bool = False, entries_sorted=True) \
+    def _collect_effective_observers(self, on_transaction_end: bool) \
             -> List[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]]:
         """
-        Retrieve a sorted list of observer entries based on the specified flags and transaction end condition.
+        Collect the entries of all observers that get notified for this object and its parents, sorted by priority.
 
         Args:
-            flags (Observable.ObserverEvent): The event flags to filter observers.
-            on_transaction_end (bool, optional): If True, only include observers that should be notified on transaction end. Defaults to False.
-            entries_sorted (bool, optional): If True, the list of observers will be sorted by priority. Defaults to True.
-
-        Returns:
-            List[Any]: A sorted list of observer entries that match the specified criteria.
-        """
-        observers: Set[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]] \
-            = set(super().get_observer_entries(flags, on_transaction_end, False))
-        if self.__parent is not None:
-            observers.update(self.__parent.get_observer_entries(flags=flags, on_transaction_end=on_transaction_end, entries_sorted=False))
-        if entries_sorted:
-            def get_priority(entry) -> int:
-                return int(entry[2])
-            return sorted(observers, key=get_priority)
-        return list(observers)
+            on_transaction_end (bool): If True, collect the observers that should be notified on transaction end.
+
+        Returns:
+            List[Any]: A sorted list of observer entries.
+        """
+        observers: List[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]] = \
+            super()._collect_effective_observers(on_transaction_end)
+        if self._parent is not None:
+            # The parent caches its effective observers, so this does not walk up the whole hierarchy
+            parent_observers = self._parent._get_effective_observers(on_transaction_end)  # pylint: disable=protected-access
+            if not observers:
+                return parent_observers
+            if parent_observers:
+                # Both lists are sorted, merging is cheaper than sorting. Observers registered on this object and a parent are only notified once
+                return list(dict.fromkeys(heapq.merge(observers, parent_observers, key=itemgetter(2))))
+        return observers
     # pylint: enable=duplicate-code
 
     @property
@@ -316,7 +428,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             str: The name attribute.
         """
-        return self.__name
+        return self._name
 
     @property
     def id(self) -> str:
@@ -326,7 +438,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             str: The identifier of the object.
         """
-        return self.__name
+        return self._name
 
     @property
     def is_changeable(self) -> bool:
@@ -346,7 +458,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             Optional[Any]: The current value of the attribute, or None if not set.
         """
-        return self.__value
+        return self._value
 
     @property
     def old_value(self) -> Optional[T]:
@@ -356,7 +468,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             Optional[Any]: The last old value of the attribute, or None if not set.
         """
-        return self.__old_value
+        return self._old_value
 
     @property
     def value_type(self) -> Optional[Type[T]]:
@@ -366,7 +478,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             Optional[Any]: The current value type of the attribute, or None if not set.
         """
-        return self.__value_type
+        return self._value_type
 
     @property
     def value_source(self) -> Optional[Any]:
@@ -376,7 +488,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             Optional[Any]: The source of the current value of the attribute, or None if not set.
         """
-        return self.__value_source
+        return self._value_source
 
     @property
     def unit(self) -> Optional[U]:
@@ -386,7 +498,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             Optional[U]: The unit of the attribute if set, otherwise None.
         """
-        return self.__unit
+        return self._unit
 
     @property
     def unit_type(self) -> Optional[Type[U]]:
@@ -396,7 +508,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             TypeVar: The unit type of the attribute.
         """
-        return self.__unit_type
+        return self._unit_type
 
     def _set_unit(self, unit: Optional[U]) -> None:
         """
@@ -408,7 +520,8 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             None
         """
-        self.__unit = unit
+        self._unit = unit
+        self._unit_str = unit.value if unit is not None else ''
 
     def _was_source(self, source: Any) -> bool:
         """
@@ -419,7 +532,7 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             bool: True if the current value was set by the given source, False otherwise.
         """
-        return self.__value_source == source
+        return self._value_source == source
 
     def _disable_if_source(self, source: Any) -> None:
         """
@@ -459,7 +572,9 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         if self._was_source(source):
             self._set_value(value, measured=measured, unit=unit, source=source)
 
-    def _set_value(self, value: Optional[T], measured: Optional[datetime] = None, unit: Optional[U] = None, source: Optional[Any] = None) -> None:
+    # pylint: disable-next=too-many-arguments, too-many-positional-arguments
+    def _set_value(self, value: Optional[T], measured: Optional[datetime] = None, unit: Optional[U] = None, source: Optional[Any] = None,
+                   now: Optional[datetime] = None) -> None:
         """
         Set the value of the attribute.
 
@@ -473,52 +588,61 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             measured (Optional[datetime], optional): The time the value was measured. Defaults to None.
             unit (Optional[U], optional): The unit of the value. Defaults to None.
             source (Optional[Any], optional): The source of the value. Defaults to None.
+            now (Optional[datetime], optional): The current time. Callers updating many attributes at once can pass a shared timestamp.
+                Defaults to None, which uses the current UTC time.
 
         Returns:
             None
         """
         with self.value_lock:
-            flags: Observable.ObserverEvent = Observable.ObserverEvent.NONE
-            now: datetime = datetime.now(tz=timezone.utc)
+            flags: int = 0
 
             if value is not None:
                 value = self.type_conversion(value)
-                self.__value_source = source
+                self._value_source = source
 
             # Value from the past
             if self.last_updated is not None and measured is not None and self.last_updated > measured:
                 LOG.debug('Value from the past: %s: %s > %s', self.name, self.last_updated, measured)
                 return
 
+            if now is None:
+                now = datetime.now(tz=_UTC)
+
             # Value was updated
             if self.last_updated_local != now:
-                flags |= Observable.ObserverEvent.UPDATED
+                flags |= _EVENT_UPDATED
                 self.last_updated_local = now
             # Value was measured
             if measured and self.last_updated != measured:
-                flags |= Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT
+                flags |= _EVENT_UPDATED_NEW_MEASUREMENT
                 self.last_updated = measured or now
             else:
                 self.last_updated = now
-            # Value was changed
-            if self.__value != value:
-                flags |= Observable.ObserverEvent.VALUE_CHANGED
-                self.__old_value = self.__value
-                self.__value = value
+            # Value was changed, the identity check spares the comparison when the very same object is set again
+            if value is not self._value and value != self._value:
+                flags |= _EVENT_VALUE_CHANGED
+                self._old_value = self._value
+                self._value = value
                 self.last_changed_local = now
                 self.last_changed = measured or now
 
-                if value is not None:
-                    self.enabled = True
-                else:
-                    self.enabled = False
-            # Unit was changed
-            if unit is not None and self.__unit != unit:
-                flags |= Observable.ObserverEvent.VALUE_CHANGED
-                self.__unit = unit
-            self.notify(flags)
-
-    def type_conversion(self, value: T) -> Any:  # pylint: disable=too-many-return-statements
+                # Enabling only goes through the setter if the state actually flips, or if the attribute sits under a disabled parent
+                # (e.g. after it was moved), which the setter repairs by enabling the parent chain. Clearing the value always goes through
+                # the setter, as it also disables the parent if no other child is enabled anymore
+                enabled: bool = value is not None
+                parent: Optional[GenericObject] = self._parent
+                if not enabled or not self._enabled or (parent is not None and not parent.enabled):
+                    self.enabled = enabled
+            # Unit was changed, units are enum members so comparing the identity is enough
+            if unit is not None and unit is not self._unit:
+                flags |= _EVENT_VALUE_CHANGED
+                self._set_unit(unit)
+            # Nothing to report if the value was rewritten with the same timestamp
+            if flags:
+                self.notify(Observable.ObserverEvent(flags))
+
+    def type_conversion(self, value: T) -> Any:
         """
         Convert the value to the correct type.
 
@@ -526,38 +650,15 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             value (T): The value to convert.
 
         Returns:
-            bool: The converted value.
+            Any: The converted value, or the value itself if no conversion is needed.
         """
-        if self.__value_type is bool and value is not None and not isinstance(value, bool):
-            LOG.debug('Implicitly converting value to bool: %s', value)
-            if isinstance(value, str):
-                if value.lower() in [x.lower() for x in ['true', 'yes', '1', 'on']]:
-                    return True
-                if value.lower() in [x.lower() for x in ['false', 'no', '0', 'off']]:
-                    return False
-                raise ValueError('Not a value that can be interpreted as valid boolean value (True/False)')
-            if isinstance(value, (float, int)):
-                if value == 0:
-                    return False
-                return True
-            return bool(value)
-        if self.__value_type is float and value is not None and not isinstance(value, float):
-            LOG.debug('Implicitly converting value to float: %s', value)
-            return float(value)
-        if self.__value_type is timedelta and value is not None and not isinstance(value, timedelta):
-            LOG.debug('Implicitly converting value to timedelta: %s', value)
-            if isinstance(value, str):
-                try:
-                    try:
-                        return timedelta(seconds=float(value))
-                    except ValueError:
-                        return timedelta(seconds=parse(value))
-                except TypeError as err:
-                    raise ValueError('Not a value that can be interpreted as valid timedelta value') from err
-            elif isinstance(value, (int, float)):
-                return timedelta(seconds=value)
-            return timedelta(value)
-        return value
+        # Values that already have the exact attribute type need no conversion, this is the common case
+        if value is None or type(value) is self._value_type:  # pylint: disable=unidiomatic-typecheck
+            return value
+        conversion: Optional[Callable[[Any], Any]] = self._type_conversion
+        if conversion is None:
+            return value
+        return conversion(value)
 
     @staticmethod
     def convert(value, from_unit: U, to_unit: U) -> T:
@@ -587,8 +688,8 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             None
         """
         with self.value_lock:
-            if unit is not None and self.__unit is not None:
-                self.value = self.convert(value=value, from_unit=unit, to_unit=self.__unit)
+            if unit is not None and self._unit is not None:
+                self.value = self.convert(value=value, from_unit=unit, to_unit=self._unit)
             else:
                 self.value = value
 
@@ -635,28 +736,47 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             bool: True if the feature is enabled, False otherwise.
         """
-        return self.__enabled
+        return self._enabled
 
     # pylint: disable=duplicate-code
     @enabled.setter
     def enabled(self, set_enabled: bool) -> None:
         if set_enabled:
-            # if the object is being enabled, we need to enable the parent first
-            if self.__parent is not None:
-                self.__parent.enabled = True
+            # if the object is being enabled, we need to enable the parent first. The whole chain is walked, as an object that was moved
+            # to a new parent can be enabled while its new parents are not
+            parent: Optional[GenericObject] = self._parent
+            if parent is not None:
+                parent.enabled = True
             # only notify if the object was not enabled before
-            if not self.__enabled:
-                self.__enabled = True
+            if self._change_enabled(parent, True):
                 self.notify(Observable.ObserverEvent.ENABLED)
         else:
+            parent = self._parent
             # only notify if the object was enabled before
-            if self.__enabled:
-                self.__enabled = False
+            if self._change_enabled(parent, False):
                 self.notify(Observable.ObserverEvent.DISABLED)
 
             # Disable parent only if all children are disabled
-            if all(not child.enabled for child in self.__parent.children):
-                self.__parent.enabled = False
+            if parent is not None and not parent._has_enabled_children():  # pylint: disable=protected-access
+                parent.enabled = False
+
+    def _change_enabled(self, parent: Optional[GenericObject], enabled: bool) -> bool:
+        """
+        Change the enabled state, together with the number of enabled children of the parent.
+
+        Args:
+            parent (Optional[GenericObject]): The parent of the attribute.
+            enabled (bool): The new enabled state.
+
+        Returns:
+            bool: True if the enabled state changed, False if the attribute already had this state.
+        """
+        if parent is not None:
+            return parent._set_child_enabled(self, enabled)  # pylint: disable=protected-access
+        if self._enabled == enabled:
+            return False
+        self._enabled = enabled
+        return True
 
     @property
     def parent(self) -> GenericObject:
@@ -666,10 +786,11 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             GenericObject: The parent object.
         """
-        if self.__parent is not None and self not in self.__parent.children:
-            raise ValueError(f'Error in structure: Parent object {self.__parent.get_absolute_path()} does not have this attribute '
+        parent: Optional[GenericObject] = self._parent
+        if parent is not None and not parent._has_child(self):  # pylint: disable=protected-access
+            raise ValueError(f'Error in structure: Parent object {parent.get_absolute_path()} does not have this attribute '
                              f'{self.get_absolute_path()} as a child')
-        return self.__parent
+        return parent
 
     @parent.setter
     def parent(self, parent: GenericObject) -> None:
@@ -682,17 +803,20 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         Returns:
             None
         """
-        if self.__parent is not None and self in self.__parent.children:
-            self.__parent.children.remove(self)
-        self.__parent = parent
-        parent.children.append(self)
+        old_parent: Optional[GenericObject] = self._parent
+        if old_parent is not None and old_parent._has_child(self):  # pylint: disable=protected-access
+            old_parent._remove_child(self)  # pylint: disable=protected-access
+        self._parent = parent
+        parent._add_child(self)  # pylint: disable=protected-access
+        self._invalidate_hierarchy_caches()
+        Observable.invalidate_observer_caches()
     # pylint: enable=duplicate-code
 
     def __str__(self) -> str:
-        unit_str = self.__unit.value if self.__unit else ""
-        return f"{self.__value}{unit_str}"
+        return f"{self._value}{self._unit_str}"
 
-    def get_by_path(self, address_string: str) -> Union[GenericObject, GenericAttribute, Literal[False]]:  # pylint: disable=too-many-return-statements
+    # pylint: disable=duplicate-code
+    def get_by_path(self, address_string: str) -> Union[GenericObject, GenericAttribute, Literal[False]]:
         """
         Retrieve an object or attribute by its path.
 
@@ -705,62 +829,96 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
             Union[GenericObject, GenericAttribute, bool]: The object or attribute found at the specified path,
                                                           or False if no matching object or attribute is found.
         """
-        # an empty string means we are looking for the current object
-        if address_string == '':
-            return self
-        # '..' means we are looking for the parent object
-        if address_string == '..':
-            if self.__parent is None:
-                return False
-            return self.__parent
-        # an absolute path starts with '/'
-        if address_string.startswith('/'):
-            return self.get_root().get_by_path(address_string[1:])
-        # a relative path
-        parts = address_string.split('/', 1)
-        for child in self.__parent.children:
-            # if the child has the same id as the first part of the address
-            if child.id == parts[0]:
-                # if there is no more parts, we found the object
-                if len(parts) == 1:
-                    return child
-                # otherwise, we continue the search with the remaining parts
-                return child.get_by_path(parts[1])
-        # if we reach this point, we did not find the object
-        return False
+        # the path is split only once, the segments are then handed down the hierarchy
+        return self._get_by_segments(address_string.split('/'), 0)
+
+    def _get_by_segments(self, segments: List[str], index: int) \
+            -> Union[GenericObject, GenericAttribute, Literal[False]]:  # pylint: disable=too-many-return-statements
+        """
+        Retrieve an object or attribute by the segments of its path.
+
+        Args:
+            segments (List[str]): The path split at '/'.
+            index (int): The index of the segment to resolve from this attribute, the segments before were already resolved.
+
+        Returns:
+            Union[GenericObject, GenericAttribute, bool]: The object or attribute found at the specified path,
+                                                          or False if no matching object or attribute is found.
+        """
+        segment: str = segments[index]
+        is_last: bool = index == len(segments) - 1
+        if is_last:
+            # an empty rest of the path means we are looking for the current object
+            if segment == '':
+                return self
+            # '..' means we are looking for the parent object
+            if segment == '..':
+                if self._parent is None:
+                    return False
+                return self._parent
+        elif segment == '':
+            # an absolute path starts with '/'
+            return self.get_root()._get_by_segments(segments, index + 1)  # pylint: disable=protected-access
+        # a relative path is resolved among the siblings
+        parent: Optional[GenericObject] = self._parent
+        if parent is None:
+            return False
+        child: Optional[Union[GenericObject, GenericAttribute]] = parent._get_child(segment)  # pylint: disable=protected-access
+        if child is None:
+            # if we reach this point, we did not find the object
+            return False
+        # if there is no more parts, we found the object
+        if is_last:
+            return child
+        # otherwise, we continue the search with the remaining parts
+        return child._get_by_segments(segments, index + 1)  # pylint: disable=protected-access
 
     def get_root(self) -> Union[GenericObject, GenericAttribute]:
         """
         Retrieve the root object in the hierarchy.
 
-        This method traverses up the parent chain to find the root object.
+        This method asks the parent for the root object, the parent caches it.
         If the current object has no parent, it is considered the root.
 
         Returns:
             Union[GenericObject, GenericAttribute]: The root object in the hierarchy.
         """
-        if self.__parent is None:
+        parent: Optional[GenericObject] = self._parent
+        if parent is None:
             return self
-        return self.__parent.get_root()
+        return parent.get_root()
 
     def get_absolute_path(self) -> str:
         """
         Constructs and returns the absolute path of the current object.
 
-        The absolute path is built by recursively calling the `get_absolute_path`
-        method on the parent object (if it exists) and appending the current object's
-        `id` to it.
+        The absolute path is built by walking up the parent chain, collecting the `id`
+        of every object on the way and joining them with '/'.
+        The result is cached until the attribute or one of its ancestors is moved to a new parent.
 
         Returns:
             str: The absolute path of the current object.
         """
-        address: str = ''
-        # if there is a parent, we get the parent's address
-        if self.__parent is not None:
-            address = f'{self.__parent.get_absolute_path()}/'
-        # we append the current object's id
-        address += f'{self.id}'
-        return address
+        if self._absolute_path is not None:
+            return self._absolute_path
+        parts: List[str] = [self.id]
+        node: Optional[Union[GenericObject, GenericAttribute]] = self._parent
+        while node is not None:
+            parts.append(node.id)
+            node = node._parent  # pylint: disable=protected-access
+        parts.reverse()
+        self._absolute_path = '/'.join(parts)
+        return self._absolute_path
+
+    def _invalidate_hierarchy_caches(self) -> None:
+        """
+        Drop the cached absolute path so it is rebuilt on the next call to get_absolute_path.
+
+        Returns:
+            None
+        """
+        self._absolute_path = None
+    # pylint: enable=duplicate-code
 
     def get_attributes(self, recursive=False) -> List[GenericAttribute]:
         """
@@ -812,16 +970,16 @@ class GenericAttribute(Observable, Generic[T, U]):  # pylint: disable=too-many-i
         if SUPPORT_IMAGES and isinstance(self.value, Image.Image):
             return None
         if pretty:
-            indent: int = 4
-        else:
-            indent = 0
-        return json.dumps(self.in_locale(in_locale)[0], cls=ExtendedWithNullEncoder, skipkeys=True, indent=indent)
+            return _JSON_ENCODER_PRETTY.encode(self.in_locale(in_locale)[0])
+        return _JSON_ENCODER.encode(self.in_locale(in_locale)[0])
 
 
 class BooleanAttribute(GenericAttribute[bool, None]):
     """
     A class used to represent a Boolean Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[bool] = None,
                  tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
@@ -832,34 +990,38 @@ class IntegerAttribute(GenericAttribute[int, None]):
     """
     A class used to represent a Integer Attribute.
     """
+    __slots__ = ('maximum', 'minimum')
+
     def __init__(self, name: str, parent: GenericObject, value: Optional[int] = None,  # pylint: disable=too-many-arguments, too-many-positional-arguments
                  maximum: Optional[int] = None, minimum: Optional[int] = None, tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, value=value, value_type=int, unit=None, tags=tags, initialization=initialization)
         self.maximum: Optional[int] = maximum
         self.minimum: Optional[int] = minimum
 
-    @GenericAttribute.value.setter
-    def value(self, new_value: int) -> None:
+    def _set_limited_value(self, new_value: int) -> None:
         """
         Overwriting value setter to check for minimum/maximum limits
         """
-        if self._is_changeable:
+        if self._is_changeable and new_value is not None:
             # First bring the value to the correct type
-            if new_value is not None:
-                new_value = self.type_conversion(new_value)
-            if self.minimum is not None and new_value is not None and new_value < self.minimum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is below minimum {self.minimum}{self.unit.value if self.unit is not None else ""}')
-            if self.maximum is not None and new_value is not None and new_value > self.maximum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is above maximum {self.maximum}{self.unit.value if self.unit is not None else ""}')
+            new_value = self.type_conversion(new_value)
+            minimum = self.minimum
+            if minimum is not None and new_value < minimum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is below minimum {minimum}{self._unit_str}')
+            maximum = self.maximum
+            if maximum is not None and new_value > maximum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is above maximum {maximum}{self._unit_str}')
         GenericAttribute.value.fset(self, new_value)  # pylint: disable=no-member
 
+    value = property(GenericAttribute.value.fget, _set_limited_value)
+
 
 class FloatAttribute(GenericAttribute[float, U]):
     """
     A class used to represent a float Attribute.
     """
+    __slots__ = ('precision', 'maximum', 'minimum')
+
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Optional[U] = None,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -869,41 +1031,46 @@ class FloatAttribute(GenericAttribute[float, U]):
         self.minimum: Optional[float] = minimum
         super().__init__(name=name, parent=parent, value=value, value_type=float, unit=unit, tags=tags, initialization=initialization)
 
-    @GenericAttribute.value.setter
-    def value(self, new_value: float) -> None:
+    def _set_limited_value(self, new_value: float) -> None:
         """
         Overwriting value setter to check for minimum/maximum limits
         """
-        if self._is_changeable:
+        if self._is_changeable and new_value is not None:
             # First bring the value to the correct type
-            if new_value is not None:
-                new_value = self.type_conversion(new_value)
-            if self.minimum is not None and new_value is not None and new_value < self.minimum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is below minimum {self.minimum}{self.unit.value if self.unit is not None else ""}')
-            if self.maximum is not None and new_value is not None and new_value > self.maximum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is above maximum {self.maximum}{self.unit.value if self.unit is not None else ""}')
+            new_value = self.type_conversion(new_value)
+            minimum = self.minimum
+            if minimum is not None and new_value < minimum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is below minimum {minimum}{self._unit_str}')
+            maximum = self.maximum
+            if maximum is not None and new_value > maximum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is above maximum {maximum}{self._unit_str}')
         GenericAttribute.value.fset(self, new_value)  # pylint: disable=no-member
 
+    value = property(GenericAttribute.value.fget, _set_limited_value)
+
 
 class EnumAttribute(Generic[T], GenericAttribute[T, None]):
     """
     A class used to represent a Enum Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[Enum] = None, value_type: Type[Enum] = Enum,
                  tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, value=value, value_type=value_type, unit=None, tags=tags, initialization=initialization)
 
     def __str__(self) -> str:
-        return f"{self.value.value if self.value else None}"
+        value: Optional[Enum] = self._value
+        return f"{value.value if value is not None else None}"
 
 
 class StringAttribute(GenericAttribute[str, None]):
     """
     A class used to represent a String Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[str] = None,
                  tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
@@ -914,6 +1081,8 @@ class DateAttribute(GenericAttribute[datetime, None]):
     """
     A class used to represent a Date Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable-next=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[datetime] = None,
                  tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
@@ -924,6 +1093,8 @@ class DurationAttribute(GenericAttribute[timedelta, None]):
     """
     A class used to represent a Duration.
     """
+    __slots__ = ('maximum', 'minimum')
+
     def __init__(self, name: str, parent: GenericObject, value: Optional[timedelta] = None,  # pylint: disable=too-many-arguments, too-many-positional-arguments
                  maximum: Optional[timedelta] = None, minimum: Optional[timedelta] = None, tags: Optional[Set[str]] = None,
                  initialization: Optional[Dict] = None) -> None:
@@ -931,28 +1102,57 @@ class DurationAttribute(GenericAttribute[timedelta, None]):
         self.maximum: Optional[timedelta] = maximum
         self.minimum: Optional[timedelta] = minimum
 
-    @GenericAttribute.value.setter
-    def value(self, new_value: timedelta) -> None:
+    def _set_limited_value(self, new_value: timedelta) -> None:
         """
         Overwriting value setter to check for minimum/maximum limits
         """
-        if self._is_changeable:
+        if self._is_changeable and new_value is not None:
             # First bring the value to the correct type
-            if new_value is not None:
-                new_value = self.type_conversion(new_value)
-            if self.minimum is not None and new_value is not None and new_value < self.minimum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is below minimum {self.minimum}{self.unit.value if self.unit is not None else ""}')
-            if self.maximum is not None and new_value is not None and new_value > self.maximum:
-                raise ValueError(f'Value {new_value}{self.unit.value if self.unit is not None else ""} '
-                                 f'is above maximum {self.maximum}{self.unit.value if self.unit is not None else ""}')
+            new_value = self.type_conversion(new_value)
+            minimum = self.minimum
+            if minimum is not None and new_value < minimum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is below minimum {minimum}{self._unit_str}')
+            maximum = self.maximum
+            if maximum is not None and new_value > maximum:
+                raise ValueError(f'Value {new_value}{self._unit_str} is above maximum {maximum}{self._unit_str}')
         GenericAttribute.value.fset(self, new_value)  # pylint: disable=no-member
 
+    value = property(GenericAttribute.value.fget, _set_limited_value)
+
+
+# Prefixes of the locales using imperial units, str.startswith accepts a tuple and checks all prefixes at once
+_MILES_LOCALES: Tuple[str, ...] = ('en_US', 'en_GB', 'en_LR', 'en_MM')
+_GALLON_LOCALES: Tuple[str, ...] = ('en_US', 'en_GB', 'en_LR', 'en_MM')
+_FAHRENHEIT_LOCALES: Tuple[str, ...] = ('en_US', 'en_BS', 'en_KY', 'en_LR', 'en_PW', 'en_FM', 'en_MH')
+
+
+# Unit conversions are stored as the operations applied to the value one after the other. Divisions are kept as divisions instead of
+# multiplying with the reciprocal, so the results are exactly the same as calculating them directly
+def _apply_conversion(value: Any, steps: ConversionSteps) -> Any:
+    for operation, operand in steps:
+        value = operation(value, operand)
+    return value
+
+
+# Conversions between all supported (from_unit, to_unit) length pairs
+_LENGTH_CONVERSIONS: Dict[Tuple[Length, Length], ConversionSteps] = {
+    (Length.MI, Length.KM): ((mul, 1.609344),),
+    (Length.KM, Length.MI): ((truediv, 1.609344),),
+    (Length.M, Length.KM): ((truediv, 1000),),
+    (Length.KM, Length.M): ((mul, 1000),),
+    (Length.FT, Length.M): ((truediv, 3.2808),),
+    (Length.M, Length.FT): ((mul, 3.2808),),
+    (Length.FT, Length.MI): ((truediv, 5280),),
+    (Length.MI, Length.FT): ((mul, 5280),),
+}
+
 
 class RangeAttribute(FloatAttribute[Length]):
     """
     A class used to represent a Range Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Length = Length.KM,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -961,7 +1161,7 @@ class RangeAttribute(FloatAttribute[Length]):
                          initialization=initialization)
 
     @staticmethod
-    def convert(value, from_unit: U, to_unit: U) -> T:  # pylint: disable=too-many-return-statements
+    def convert(value, from_unit: U, to_unit: U) -> T:
         """
         Convert a range value from one unit to another.
 
@@ -978,25 +1178,12 @@ class RangeAttribute(FloatAttribute[Length]):
         - Kilometers to miles
         - Miles to kilometers
         """
-        if from_unit is None or to_unit is None or value is None or from_unit == to_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == Length.MI and to_unit == Length.KM:
-            return value * 1.609344
-        if from_unit == Length.KM and to_unit == Length.MI:
-            return value / 1.609344
-        if from_unit == Length.M and to_unit == Length.KM:
-            return value / 1000
-        if from_unit == Length.KM and to_unit == Length.M:
-            return value * 1000
-        if from_unit == Length.FT and to_unit == Length.M:
-            return value / 3.2808
-        if from_unit == Length.M and to_unit == Length.FT:
-            return value * 3.2808
-        if from_unit == Length.FT and to_unit == Length.MI:
-            return value / 5280
-        if from_unit == Length.MI and to_unit == Length.FT:
-            return value * 5280
-        return value
+        steps: Optional[ConversionSteps] = _LENGTH_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def range_in(self, unit: Length) -> Optional[float]:
         """
@@ -1010,6 +1197,8 @@ class RangeAttribute(FloatAttribute[Length]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[float], Optional[U]]:
@@ -1026,19 +1215,27 @@ class RangeAttribute(FloatAttribute[Length]):
         """
         if locale is None:
             return self.value, self.unit
-        miles_locales: list[str] = ['en_US', 'en_GB', 'en_LR', 'en_MM']
-        if any(locale.startswith(loc) for loc in miles_locales):
-            if self.unit == Length.KM:
+        if locale.startswith(_MILES_LOCALES):
+            if self.unit is Length.KM:
                 return self.range_in(Length.MI), Length.MI
-            if self.unit == Length.M:
+            if self.unit is Length.M:
                 return self.range_in(Length.FT), Length.FT
         return self.range_in(Length.KM), Length.KM
 
 
+# Conversions between all supported (from_unit, to_unit) speed pairs
+_SPEED_CONVERSIONS: Dict[Tuple[Speed, Speed], ConversionSteps] = {
+    (Speed.MPH, Speed.KMH): ((mul, 1.609344),),
+    (Speed.KMH, Speed.MPH): ((truediv, 1.609344),),
+}
+
+
 class SpeedAttribute(FloatAttribute[Speed]):
     """
     A class used to represent a Speed Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Speed = Speed.KMH,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1064,13 +1261,12 @@ class SpeedAttribute(FloatAttribute[Speed]):
         - Kilometers per hour to miles per hour
         - Miles per hour to kilometers per hour
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == Speed.MPH and to_unit == Speed.KMH:
-            return value * 1.609344
-        if from_unit == Speed.KMH and to_unit == Speed.MPH:
-            return value / 1.609344
-        return value
+        steps: Optional[ConversionSteps] = _SPEED_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def speed_in(self, unit: Speed) -> Optional[float]:
         """
@@ -1084,6 +1280,8 @@ class SpeedAttribute(FloatAttribute[Speed]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[float], Optional[U]]:
@@ -1100,16 +1298,24 @@ class SpeedAttribute(FloatAttribute[Speed]):
         """
         if locale is None:
             return self.value, self.unit
-        miles_locales: list[str] = ['en_US', 'en_GB', 'en_LR', 'en_MM']
-        if any(locale.startswith(loc) for loc in miles_locales):
+        if locale.startswith(_MILES_LOCALES):
             return self.speed_in(Speed.MPH), Speed.MPH
         return self.speed_in(Speed.KMH), Speed.KMH
 
 
+# Conversions between all supported (from_unit, to_unit) power pairs
+_POWER_CONVERSIONS: Dict[Tuple[Power, Power], ConversionSteps] = {
+    (Power.W, Power.KW): ((truediv, 1000),),
+    (Power.KW, Power.W): ((mul, 1000),),
+}
+
+
 class PowerAttribute(FloatAttribute[Power]):
     """
     A class used to represent a power Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Power = Power.KW,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1135,13 +1341,12 @@ class PowerAttribute(FloatAttribute[Power]):
         - Watts to Kilowatts
         - Kilowatts to Watts
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == Power.W and to_unit == Power.KW:
-            return value / 1000
-        if from_unit == Power.KW and to_unit == Power.W:
-            return value * 1000
-        return value
+        steps: Optional[ConversionSteps] = _POWER_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def power_in(self, unit: Power) -> Optional[float]:
         """
@@ -1155,13 +1360,24 @@ class PowerAttribute(FloatAttribute[Power]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
 
+# Conversions between all supported (from_unit, to_unit) energy pairs
+_ENERGY_CONVERSIONS: Dict[Tuple[Energy, Energy], ConversionSteps] = {
+    (Energy.WH, Energy.KWH): ((truediv, 1000),),
+    (Energy.KWH, Energy.WH): ((mul, 1000),),
+}
+
+
 class EnergyAttribute(FloatAttribute[Energy]):
     """
     A class used to represent a energy Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Energy = Energy.KWH,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1187,13 +1403,12 @@ class EnergyAttribute(FloatAttribute[Energy]):
         - Watthours to Kilowatthours
         - Kilowatthours to Watthours
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == Energy.WH and to_unit == Energy.KWH:
-            return value / 1000
-        if from_unit == Energy.KWH and to_unit == Energy.WH:
-            return value * 1000
-        return value
+        steps: Optional[ConversionSteps] = _ENERGY_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def energy_in(self, unit: Energy) -> Optional[float]:
         """
@@ -1207,6 +1422,8 @@ class EnergyAttribute(FloatAttribute[Energy]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
 
@@ -1214,6 +1431,8 @@ class CurrentAttribute(FloatAttribute[Current]):
     """
     A class used to represent a current Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Current = Current.A,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1226,6 +1445,8 @@ class LevelAttribute(FloatAttribute[Level]):
     """
     A class used to represent a Level Attribute.
     """
+    __slots__ = ()
+
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None,  # pylint: disable=too-many-arguments, too-many-positional-arguments
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
                  tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
@@ -1233,10 +1454,23 @@ class LevelAttribute(FloatAttribute[Level]):
                          initialization=initialization)
 
 
+# Conversions between all supported (from_unit, to_unit) temperature pairs
+_TEMPERATURE_CONVERSIONS: Dict[Tuple[Temperature, Temperature], ConversionSteps] = {
+    (Temperature.F, Temperature.C): ((sub, 32.0), (mul, 5.0 / 9.0)),
+    (Temperature.K, Temperature.C): ((sub, 273.15),),
+    (Temperature.C, Temperature.F): ((mul, 9.0 / 5.0), (add, 32.0)),
+    (Temperature.K, Temperature.F): ((sub, 273.15), (mul, 9.0 / 5.0), (add, 32.0)),
+    (Temperature.C, Temperature.K): ((add, 273.15),),
+    (Temperature.F, Temperature.K): ((sub, 32.0), (mul, 5.0 / 9.0), (add, 273.15)),
+}
+
+
 class TemperatureAttribute(FloatAttribute[Temperature]):
     """
     A class used to represent a Temperature Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[T] = None, unit: Temperature = Temperature.C,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1245,7 +1479,7 @@ class TemperatureAttribute(FloatAttribute[Temperature]):
                          initialization=initialization)
 
     @staticmethod
-    def convert(value, from_unit: U, to_unit: U) -> T:  # pylint: disable=too-many-return-statements
+    def convert(value, from_unit: U, to_unit: U) -> T:
         """
         Convert a temperature value from one unit to another.
 
@@ -1266,24 +1500,12 @@ class TemperatureAttribute(FloatAttribute[Temperature]):
         - Kelvin to Celsius
         - Kelvin to Fahrenheit
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if to_unit == Temperature.C:
-            if from_unit == Temperature.F:
-                return (value - 32.0) * (5.0 / 9.0)
-            if from_unit == Temperature.K:
-                return value - 273.15
-        if to_unit == Temperature.F:
-            if from_unit == Temperature.C:
-                return ((value * (9.0 / 5.0)) + 32.0)
-            if from_unit == Temperature.K:
-                return ((value - 273.15) * (9.0 / 5.0)) + 32.0
-        if to_unit == Temperature.K:
-            if from_unit == Temperature.C:
-                return value + 273.15
-            if from_unit == Temperature.F:
-                return 273.5 + ((value - 32.0) * (5.0 / 9.0))
-        return value
+        steps: Optional[ConversionSteps] = _TEMPERATURE_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def temperature_in(self, unit: U) -> Optional[float]:
         """
@@ -1297,12 +1519,13 @@ class TemperatureAttribute(FloatAttribute[Temperature]):
         """
         if unit is None:
             raise ValueError('No unit specified')
-        if self.unit is None:
-            target_unit = Temperature.C
-            LOG.warning('No unit specified for temperature in Attribute %s, defaulting to Celsius', self.name)
-        else:
-            target_unit = self.unit
-        return self.convert(self.value, target_unit, unit)
+        own_unit: Optional[U] = self.unit
+        if own_unit is not None:
+            if unit is own_unit:
+                return self.value
+            return self.convert(self.value, own_unit, unit)
+        LOG.warning('No unit specified for temperature in Attribute %s, defaulting to Celsius', self.name)
+        return self.convert(self.value, Temperature.C, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[T], Optional[U]]:
         """
@@ -1318,8 +1541,7 @@ class TemperatureAttribute(FloatAttribute[Temperature]):
         """
         if locale is None:
             return self.value, self.unit
-        fahrenheit_locales: list[str] = ['en_US', 'en_BS', 'en_KY', 'en_LR', 'en_PW', 'en_FM', 'en_MH']
-        if any(locale.startswith(loc) for loc in fahrenheit_locales):
+        if locale.startswith(_FAHRENHEIT_LOCALES):
             return self.temperature_in(Temperature.F), Temperature.F
         return self.temperature_in(Temperature.C), Temperature.C
 
@@ -1329,6 +1551,8 @@ if SUPPORT_IMAGES:
         """
         A class used to represent a Image Attribute.
         """
+        __slots__ = ()
+
         # pylint: disable=too-many-arguments, too-many-positional-arguments
         def __init__(self, name: str, parent: GenericObject, value: Optional[Image] = None, value_type: Type[Image] = Image,
                      tags: Optional[Set[str]] = None, initialization: Optional[Dict] = None) -> None:
@@ -1341,10 +1565,29 @@ if SUPPORT_IMAGES:
             return f"{self.name}"
 
 
+# Conversions between all supported (from_unit, to_unit) energy consumption pairs
+_ENERGY_CONSUMPTION_CONVERSIONS: Dict[Tuple[EnergyConsumption, EnergyConsumption], ConversionSteps] = {
+    (EnergyConsumption.KWH100MI, EnergyConsumption.KWH100KM): ((mul, 1.609344),),
+    (EnergyConsumption.KWH100MI, EnergyConsumption.WHKM): ((mul, 1.609344), (mul, 10)),
+    (EnergyConsumption.KWH100MI, EnergyConsumption.WHMI): ((mul, 10),),
+    (EnergyConsumption.KWH100KM, EnergyConsumption.KWH100MI): ((truediv, 1.609344),),
+    (EnergyConsumption.KWH100KM, EnergyConsumption.WHMI): ((truediv, 1.609344), (mul, 10)),
+    (EnergyConsumption.KWH100KM, EnergyConsumption.WHKM): ((mul, 10),),
+    (EnergyConsumption.WHKM, EnergyConsumption.KWH100KM): ((truediv, 10),),
+    (EnergyConsumption.WHKM, EnergyConsumption.KWH100MI): ((truediv, 1.609344), (truediv, 10)),
+    (EnergyConsumption.WHKM, EnergyConsumption.WHMI): ((truediv, 1.609344),),
+    (EnergyConsumption.WHMI, EnergyConsumption.KWH100MI): ((truediv, 10),),
+    (EnergyConsumption.WHMI, EnergyConsumption.KWH100KM): ((truediv, 10), (mul, 1.609344)),
+    (EnergyConsumption.WHMI, EnergyConsumption.WHKM): ((mul, 1.609344),),
+}
+
+
 class EnergyConsumptionAttribute(FloatAttribute[EnergyConsumption]):
     """
     A class used to represent a Energy Consumption Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: EnergyConsumption = EnergyConsumption.KWH100KM,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1353,7 +1596,7 @@ class EnergyConsumptionAttribute(FloatAttribute[EnergyConsumption]):
                          initialization=initialization)
 
     @staticmethod
-    def convert(value, from_unit: U, to_unit: U) -> T:  # pylint: disable=too-many-return-statements,too-many-branches
+    def convert(value, from_unit: U, to_unit: U) -> T:
         """
         Convert a range value from one unit to another.
 
@@ -1366,33 +1609,12 @@ class EnergyConsumptionAttribute(FloatAttribute[EnergyConsumption]):
         float: The converted range value in the desired unit. If any of the parameters are None or if the units are the same,
         the original value is returned.
         """
-        if from_unit is None or to_unit is None or value is None or from_unit == to_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == EnergyConsumption.KWH100MI and to_unit == EnergyConsumption.KWH100KM:
-            return value * 1.609344
-        if from_unit == EnergyConsumption.KWH100MI and to_unit == EnergyConsumption.WHKM:
-            return value * 1.609344 * 10
-        if from_unit == EnergyConsumption.KWH100MI and to_unit == EnergyConsumption.WHMI:
-            return value * 10
-        if from_unit == EnergyConsumption.KWH100KM and to_unit == EnergyConsumption.KWH100MI:
-            return value / 1.609344
-        if from_unit == EnergyConsumption.KWH100KM and to_unit == EnergyConsumption.WHMI:
-            return value / 1.609344 * 10
-        if from_unit == EnergyConsumption.KWH100KM and to_unit == EnergyConsumption.WHKM:
-            return value * 10
-        if from_unit == EnergyConsumption.WHKM and to_unit == EnergyConsumption.KWH100KM:
-            return value / 10
-        if from_unit == EnergyConsumption.WHKM and to_unit == EnergyConsumption.KWH100MI:
-            return value / 1.609344 / 10
-        if from_unit == EnergyConsumption.WHKM and to_unit == EnergyConsumption.WHMI:
-            return value / 1.609344
-        if from_unit == EnergyConsumption.WHMI and to_unit == EnergyConsumption.KWH100MI:
-            return value / 10
-        if from_unit == EnergyConsumption.WHMI and to_unit == EnergyConsumption.KWH100KM:
-            return value / 10 * 1.609344
-        if from_unit == EnergyConsumption.WHMI and to_unit == EnergyConsumption.WHKM:
-            return value * 1.609344
-        return value
+        steps: Optional[ConversionSteps] = _ENERGY_CONSUMPTION_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def consumption_in(self, unit: EnergyConsumption) -> Optional[float]:
         """
@@ -1406,6 +1628,8 @@ class EnergyConsumptionAttribute(FloatAttribute[EnergyConsumption]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[float], Optional[U]]:
@@ -1422,19 +1646,27 @@ class EnergyConsumptionAttribute(FloatAttribute[EnergyConsumption]):
         """
         if locale is None:
             return self.value, self.unit
-        miles_locales: list[str] = ['en_US', 'en_GB', 'en_LR', 'en_MM']
-        if any(locale.startswith(loc) for loc in miles_locales):
-            if self.unit == EnergyConsumption.KWH100KM:
+        if locale.startswith(_MILES_LOCALES):
+            if self.unit is EnergyConsumption.KWH100KM:
                 return self.consumption_in(EnergyConsumption.KWH100MI), EnergyConsumption.KWH100MI
-            if self.unit == EnergyConsumption.WHKM:
+            if self.unit is EnergyConsumption.WHKM:
                 return self.consumption_in(EnergyConsumption.WHMI), EnergyConsumption.WHMI
         return self.consumption_in(EnergyConsumption.KWH100KM), EnergyConsumption.KWH100KM
 
 
+# Conversions between all supported (from_unit, to_unit) fuel consumption pairs
+_FUEL_CONSUMPTION_CONVERSIONS: Dict[Tuple[FuelConsumption, FuelConsumption], ConversionSteps] = {
+    (FuelConsumption.L100KM, FuelConsumption.MPG): ((mul, 235.15),),
+    (FuelConsumption.MPG, FuelConsumption.L100KM): ((truediv, 235.15),),
+}
+
+
 class FuelConsumptionAttribute(FloatAttribute[FuelConsumption]):
     """
     A class used to represent a energy Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: FuelConsumption = FuelConsumption.L100KM,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1456,13 +1688,12 @@ class FuelConsumptionAttribute(FloatAttribute[FuelConsumption]):
         float: The converted fuel consumption value in the desired unit. If any of the parameters are None or if the units are the same,
         the original value is returned.
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == FuelConsumption.L100KM and to_unit == FuelConsumption.MPG:
-            return value * 235.15
-        if from_unit == FuelConsumption.MPG and to_unit == FuelConsumption.L100KM:
-            return value / 235.15
-        return value
+        steps: Optional[ConversionSteps] = _FUEL_CONSUMPTION_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def consumption_in(self, unit: FuelConsumption) -> Optional[float]:
         """
@@ -1476,6 +1707,8 @@ class FuelConsumptionAttribute(FloatAttribute[FuelConsumption]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[float], Optional[U]]:
@@ -1492,17 +1725,25 @@ class FuelConsumptionAttribute(FloatAttribute[FuelConsumption]):
         """
         if locale is None:
             return self.value, self.unit
-        miles_locales: list[str] = ['en_US', 'en_GB', 'en_LR', 'en_MM']
-        if any(locale.startswith(loc) for loc in miles_locales):
-            if self.unit == FuelConsumption.L100KM:
+        if locale.startswith(_MILES_LOCALES):
+            if self.unit is FuelConsumption.L100KM:
                 return self.consumption_in(FuelConsumption.MPG), FuelConsumption.MPG
         return self.consumption_in(FuelConsumption.L100KM), FuelConsumption.L100KM
 
 
+# Conversions between all supported (from_unit, to_unit) volume pairs
+_VOLUME_CONVERSIONS: Dict[Tuple[Volume, Volume], ConversionSteps] = {
+    (Volume.L, Volume.GAL): ((mul, 0.264172),),
+    (Volume.GAL, Volume.L): ((mul, 3.78541),),
+}
+
+
 class VolumeAttribute(FloatAttribute[Volume]):
     """
     A class used to represent a Speed Attribute.
     """
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(self, name: str, parent: GenericObject, value: Optional[float] = None, unit: Volume = Volume.L,
                  maximum: Optional[float] = None, minimum: Optional[float] = None, precision: Optional[float] = None,
@@ -1524,13 +1765,12 @@ class VolumeAttribute(FloatAttribute[Volume]):
         float: The converted volume value in the desired unit. If any of the parameters are None or if the units are the same,
         the original value is returned.
         """
-        if from_unit is None or to_unit is None or value is None or to_unit == from_unit:
+        if from_unit is None or to_unit is None or value is None or from_unit is to_unit:
             return value
-        if from_unit == Volume.L and to_unit == Volume.GAL:
-            return value * 0.264172
-        if from_unit == Volume.GAL and to_unit == Volume.L:
-            return value * 3.78541
-        return value
+        steps: Optional[ConversionSteps] = _VOLUME_CONVERSIONS.get((from_unit, to_unit))
+        if steps is None:
+            return value
+        return _apply_conversion(value, steps)
 
     def volume_in(self, unit: Volume) -> Optional[float]:
         """
@@ -1544,6 +1784,8 @@ class VolumeAttribute(FloatAttribute[Volume]):
         """
         if unit is None or self.unit is None:
             raise ValueError('No unit specified or value has no unit')
+        if unit is self.unit:
+            return self.value
         return self.convert(self.value, self.unit, unit)
 
     def in_locale(self, locale: Optional[str]) -> Tuple[Optional[float], Optional[U]]:
@@ -1560,7 +1802,6 @@ class VolumeAttribute(FloatAttribute[Volume]):
         """
         if locale is None:
             return self.value, self.unit
-        gal_locales: list[str] = ['en_US', 'en_GB', 'en_LR', 'en_MM']
-        if any(locale.startswith(loc) for loc in gal_locales):
+        if locale.startswith(_GALLON_LOCALES):
             return self.volume_in(Volume.GAL), Volume.GAL
         return self.volume_in(Volume.L), Volume.L
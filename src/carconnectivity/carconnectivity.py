@@ -255,16 +255,18 @@ class CarConnectivity(GenericObject, ICarConnectivity):  # pylint: disable=too-m
             for connector_config in config['carConnectivity']['connectors']:
                 if 'type' not in connector_config:
                     raise ConfigurationError("Invalid configuration: 'type' is missing in connector")
-                if f"carconnectivity_connectors.{connector_config['type']}" not in discovered_connectors:
-                    raise ConfigurationError(f"Invalid configuration: connector type '{connector_config['type']}' is not known")
+                connector_type: str = connector_config['type']
+                connector_module: Optional[ModuleType] = discovered_connectors.get(f"carconnectivity_connectors.{connector_type}")
+                if connector_module is None:
+                    raise ConfigurationError(f"Invalid configuration: connector type '{connector_type}' is not known")
                 if 'disabled' in connector_config and connector_config['disabled']:
-                    LOG.info('Skipping disabled connector %s', connector_config['type'])
+                    LOG.info('Skipping disabled connector %s', connector_type)
                     continue
-                connector_class = getattr(discovered_connectors['carconnectivity_connectors.' + connector_config['type']], 'Connector')
+                connector_class = connector_module.Connector
                 if 'connector_id' in connector_config and connector_config['connector_id'] is not None:
                     connector_id = connector_config['connector_id']
                 else:
-                    connector_id = connector_config['type']
+                    connector_id = connector_type
                 if connector_id in self.connectors.connectors:
                     raise ConfigurationError(f"Invalid configuration: connector '{connector_id}' is not unique, set a 'connector_id' in configuration")
                 connector: BaseConnector = connector_class(connector_id=connector_id, car_connectivity=self, config=connector_config['config'],
@@ -285,16 +287,18 @@ class CarConnectivity(GenericObject, ICarConnectivity):  # pylint: disable=too-m
             for plugin_config in config['carConnectivity']['plugins']:
                 if 'type' not in plugin_config:
                     raise ConfigurationError("Invalid configuration: 'type' is missing in plugin")
-                if f"carconnectivity_plugins.{plugin_config['type']}" not in discovered_plugins:
-                    raise ConfigurationError(f"Invalid configuration: plugin type '{plugin_config['type']}' is not known")
+                plugin_type: str = plugin_config['type']
+                plugin_module: Optional[ModuleType] = discovered_plugins.get(f"carconnectivity_plugins.{plugin_type}")
+                if plugin_module is None:
+                    raise ConfigurationError(f"Invalid configuration: plugin type '{plugin_type}' is not known")
                 if 'disabled' in plugin_config and plugin_config['disabled']:
-                    LOG.info('Skipping disabled plugin %s', plugin_config['type'])
+                    LOG.info('Skipping disabled plugin %s', plugin_type)
                     continue
-                plugin_class = getattr(discovered_plugins['carconnectivity_plugins.' + plugin_config['type']], 'Plugin')
+                plugin_class = plugin_module.Plugin
                 if 'plugin_id' in plugin_config and plugin_config['plugin_id'] is not None:
                     plugin_id: str = plugin_config['plugin_id']
                 else:
-                    plugin_id: str = plugin_config['type']
+                    plugin_id: str = plugin_type
                 if plugin_id in self.plugins.plugins:
                     raise ConfigurationError(f"Invalid configuration: connector '{plugin_id}' is not unique, set a 'connector_id' in configuration")
                 plugin: BasePlugin = plugin_class(plugin_id=plugin_id, car_connectivity=self, config=plugin_config['config'],
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
 LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 DEFAULT_LOG_LEVEL = "ERROR"
+DEFAULT_LOG_LEVEL_INDEX: int = LOG_LEVELS.index(DEFAULT_LOG_LEVEL)
 
 LOG: logging.Logger = logging.getLogger("carconnectivity")
 
@@ -78,9 +79,8 @@ class CLI():  # pylint: disable=too-few-public-methods
         Entry point for the command-line interface.
         """
         args = self.parser.parse_args()
-        log_level = LOG_LEVELS.index(DEFAULT_LOG_LEVEL)
-        for adjustment in args.verbose or ():
-            log_level = min(len(LOG_LEVELS) - 1, max(log_level + adjustment, 0))
+        # All adjustments move into the same direction, so clamping the sum is the same as clamping after each step
+        log_level = max(0, min(len(LOG_LEVELS) - 1, DEFAULT_LOG_LEVEL_INDEX + sum(args.verbose or ())))
 
         logging.basicConfig(level=LOG_LEVELS[log_level], format=args.logging_format, datefmt=args.logging_date_format)
         if args.hide_repeated_log:
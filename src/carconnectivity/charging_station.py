@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from datetime import datetime, timezone
+
 from carconnectivity.objects import GenericObject
 from carconnectivity.attributes import StringAttribute, FloatAttribute, IntegerAttribute
 from carconnectivity.units import LatitudeLongitude, Power
@@ -56,14 +58,15 @@ class ChargingStation(GenericObject):  # pylint: disable=too-few-public-methods,
         """
         Clears all charging station data attributes.
         """
-        self.source._set_value(None)  # pylint: disable=protected-access
-        self.uid._set_value(None)  # pylint: disable=protected-access
-        self.name._set_value(None)  # pylint: disable=protected-access
-        self.latitude._set_value(None)  # pylint: disable=protected-access
-        self.longitude._set_value(None)  # pylint: disable=protected-access
-        self.address._set_value(None)  # pylint: disable=protected-access
-        self.max_power._set_value(None)  # pylint: disable=protected-access
-        self.num_spots._set_value(None)  # pylint: disable=protected-access
-        self.operator_id._set_value(None)  # pylint: disable=protected-access
-        self.operator_name._set_value(None)  # pylint: disable=protected-access
-        self.raw._set_value(None)  # pylint: disable=protected-access
+        now: datetime = datetime.now(tz=timezone.utc)
+        self.source._set_value(None, now=now)  # pylint: disable=protected-access
+        self.uid._set_value(None, now=now)  # pylint: disable=protected-access
+        self.name._set_value(None, now=now)  # pylint: disable=protected-access
+        self.latitude._set_value(None, now=now)  # pylint: disable=protected-access
+        self.longitude._set_value(None, now=now)  # pylint: disable=protected-access
+        self.address._set_value(None, now=now)  # pylint: disable=protected-access
+        self.max_power._set_value(None, now=now)  # pylint: disable=protected-access
+        self.num_spots._set_value(None, now=now)  # pylint: disable=protected-access
+        self.operator_id._set_value(None, now=now)  # pylint: disable=protected-access
+        self.operator_name._set_value(None, now=now)  # pylint: disable=protected-access
+        self.raw._set_value(None, now=now)  # pylint: disable=protected-access
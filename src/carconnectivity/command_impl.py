@@ -26,6 +26,8 @@ class UpdateCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for triggering updates
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'update', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
@@ -88,6 +90,8 @@ class ClimatizationStartStopCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for climatization.
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'start-stop', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
@@ -167,6 +171,8 @@ class ChargingStartStopCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for charging.
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'start-stop', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
@@ -227,6 +233,8 @@ class HonkAndFlashCommand(GenericCommand):
     """
     HonkAndFlashCommand is a command class for honking and flashing the lights.
     """
+    __slots__ = ('with_duration',)
+
     def __init__(self, name: str = 'honk-flash', parent: Optional[GenericObject] = None, with_duration: bool = False,
                  initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
@@ -296,6 +304,8 @@ class LockUnlockCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for locking.
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'lock-unlock', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
@@ -359,6 +369,8 @@ class WakeSleepCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for wake/sleep.
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'wake-sleep', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
@@ -424,6 +436,8 @@ class WindowHeatingStartStopCommand(GenericCommand):
     Command (Enum): Enum class representing different commands for window heating.
 
     """
+    __slots__ = ()
+
     def __init__(self, name: str = 'start-stop', parent: Optional[GenericObject] = None, initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, initialization=initialization)
 
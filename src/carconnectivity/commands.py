@@ -56,6 +56,8 @@ class GenericCommand(GenericAttribute[Union[str, Dict], None]):
         name (str): The name of the command.
         parent (GenericObject): The parent object of the command.
     """
+    __slots__ = ()
+
     def __init__(self, name: str, parent: Optional[GenericObject], initialization: Optional[Dict] = None) -> None:
         super().__init__(name=name, parent=parent, value=None, unit=None, initialization=initialization)
         self._is_changeable: bool = True
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from datetime import datetime, timezone
+
 from carconnectivity.objects import GenericObject
 from carconnectivity.attributes import StringAttribute, FloatAttribute
 from carconnectivity.units import LatitudeLongitude
@@ -68,20 +70,21 @@ class Location(GenericObject):  # pylint: disable=too-few-public-methods, too-ma
         """
         Clears all location data attributes.
         """
-        self.source._set_value(None)  # pylint: disable=protected-access
-        self.uid._set_value(None)  # pylint: disable=protected-access
-        self.latitude._set_value(None)  # pylint: disable=protected-access
-        self.longitude._set_value(None)  # pylint: disable=protected-access
-        self.display_name._set_value(None)  # pylint: disable=protected-access
-        self.name._set_value(None)  # pylint: disable=protected-access
-        self.amenity._set_value(None)  # pylint: disable=protected-access
-        self.house_number._set_value(None)  # pylint: disable=protected-access
-        self.road._set_value(None)  # pylint: disable=protected-access
-        self.neighbourhood._set_value(None)  # pylint: disable=protected-access
-        self.city._set_value(None)  # pylint: disable=protected-access
-        self.postcode._set_value(None)  # pylint: disable=protected-access
-        self.county._set_value(None)  # pylint: disable=protected-access
-        self.country._set_value(None)  # pylint: disable=protected-access
-        self.state._set_value(None)  # pylint: disable=protected-access
-        self.state_district._set_value(None)  # pylint: disable=protected-access
-        self.raw._set_value(None)  # pylint: disable=protected-access
+        now: datetime = datetime.now(tz=timezone.utc)
+        self.source._set_value(None, now=now)  # pylint: disable=protected-access
+        self.uid._set_value(None, now=now)  # pylint: disable=protected-access
+        self.latitude._set_value(None, now=now)  # pylint: disable=protected-access
+        self.longitude._set_value(None, now=now)  # pylint: disable=protected-access
+        self.display_name._set_value(None, now=now)  # pylint: disable=protected-access
+        self.name._set_value(None, now=now)  # pylint: disable=protected-access
+        self.amenity._set_value(None, now=now)  # pylint: disable=protected-access
+        self.house_number._set_value(None, now=now)  # pylint: disable=protected-access
+        self.road._set_value(None, now=now)  # pylint: disable=protected-access
+        self.neighbourhood._set_value(None, now=now)  # pylint: disable=protected-access
+        self.city._set_value(None, now=now)  # pylint: disable=protected-access
+        self.postcode._set_value(None, now=now)  # pylint: disable=protected-access
+        self.county._set_value(None, now=now)  # pylint: disable=protected-access
+        self.country._set_value(None, now=now)  # pylint: disable=protected-access
+        self.state._set_value(None, now=now)  # pylint: disable=protected-access
+        self.state_district._set_value(None, now=now)  # pylint: disable=protected-access
+        self.raw._set_value(None, now=now)  # pylint: disable=protected-access
@@ -12,6 +12,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import json
+import heapq
+
+from operator import itemgetter
 
 from carconnectivity.attributes import GenericAttribute
 from carconnectivity.observable import Observable
@@ -26,7 +29,7 @@ except ImportError:
     pass
 
 if TYPE_CHECKING:
-    from typing import Optional, Union, Literal, Callable, Tuple, Set, List, Any, Dict
+    from typing import Optional, Union, Literal, Callable, Tuple, List, Any, Dict
 
 
 class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
@@ -48,18 +51,25 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
                  initialization: Optional[Dict[str, Any]] = None) -> None:
         if origin is not None:
             super().__init__(origin=origin)
-            self.__id: str = origin.id
-            self.__children: List[Union[GenericObject, GenericAttribute]] = origin.children
-            for child in self.__children:
+            self._id: str = origin.id
+            self._enabled: bool = origin.enabled
+            self._enabled_lock: TimeoutLock = origin._enabled_lock  # pylint:disable=protected-access
+            self._enabled_children: int = 0
+            self._children: List[Union[GenericObject, GenericAttribute]] = origin.children
+            self._children_by_id: Dict[str, List[Union[GenericObject, GenericAttribute]]] = origin._children_by_id  # pylint:disable=protected-access
+            # The list is shared with origin and is changed by reparenting, so iterate over a copy to not skip any child
+            for child in list(self._children):
                 child.parent = self
-            self.__parent: Optional[GenericObject] = origin.parent
+            with self._enabled_lock:
+                self._enabled_children = sum(1 for child in self._children if child.enabled)
+            self._parent: Optional[GenericObject] = origin.parent
             origin.parent = None
             if parent is not None:
                 self.parent = parent
-            self.__enabled: bool = origin.enabled
-            self.__enabled_lock: TimeoutLock = origin.__enabled_lock  # pylint:disable=protected-access
-            self.__initialized: bool = origin.__initialized  # pylint:disable=protected-access
-            self.__initialization: Optional[Dict[str, Any]] = origin.__initialization  # pylint:disable=protected-access
+            self._initialized: bool = origin._initialized  # pylint:disable=protected-access
+            self._initialization: Optional[Dict[str, Any]] = origin._initialization  # pylint:disable=protected-access
+            self._absolute_path: Optional[str] = None
+            self._root: Optional[GenericObject] = None
             if self.enabled:
                 self.notify(flags=Observable.ObserverEvent.UPDATED)
         else:
@@ -68,15 +78,21 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
                 raise ValueError('ID cannot be None')
             if '/' in object_id:
                 raise ValueError('ID cannot contain /')
-            self.__id: str = object_id
-            self.__parent: Optional[GenericObject] = parent
-            self.__enabled: bool = False
-            self.__enabled_lock: TimeoutLock = TimeoutLock(timeout=5.0)
-            self.__initialized: bool = False
-            self.__initialization: Optional[Dict[str, Any]] = initialization
+            self._id: str = object_id
+            self._parent: Optional[GenericObject] = parent
+            self._enabled: bool = False
+            self._enabled_lock: TimeoutLock = TimeoutLock(timeout=5.0)
+            self._initialized: bool = False
+            self._initialization: Optional[Dict[str, Any]] = initialization
+            self._absolute_path: Optional[str] = None
+            self._root: Optional[GenericObject] = None
             if parent is not None:
-                parent.children.append(self)
-            self.__children: List[Union[GenericObject, GenericAttribute]] = []
+                parent._add_child(self)  # pylint: disable=protected-access
+            self._children: List[Union[GenericObject, GenericAttribute]] = []
+            # Children by ID in the order they were added. IDs are normally unique, so the lists usually hold a single child
+            self._children_by_id: Dict[str, List[Union[GenericObject, GenericAttribute]]] = {}
+            # Number of enabled children, maintained by the children, to decide if the object needs to be disabled without scanning all children
+            self._enabled_children: int = 0
             if initialization is not None:
                 self.initialize(initialization)
 
@@ -87,7 +103,7 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
             bool: True if the object has been initialized, False otherwise.
         """
 
-        return self.__initialized
+        return self._initialized
 
     def get_initialization(self, child: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -101,10 +117,10 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
                 When child is None, returns the complete initialization dictionary.
         """
         if child is not None:
-            if self.__initialization is not None and child in self.__initialization:
-                return self.__initialization[child]
+            if self._initialization is not None and child in self._initialization:
+                return self._initialization[child]
             return None
-        return self.__initialization
+        return self._initialization
 
     def initialize(self, initialization: Dict[str, Any]) -> None:
         """
@@ -121,8 +137,8 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
             - Only GenericAttribute and GenericObject children that have not been previously initialized will be updated.
             - Child objects are matched by their ID against the keys in the initialization dictionary.
         """
-        self.__initialization = initialization
-        for child in self.__children:
+        self._initialization = initialization
+        for child in self._children:
             if child.id in initialization:
                 init_value = initialization[child.id]
                 if isinstance(child, GenericAttribute) and not child.was_initialized():
@@ -131,11 +147,11 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
                     child.initialize(init_value)
                 else:
                     raise ValueError(f'Cannot initialize child {child.id} of type {type(child)}')
-        self.__initialized = True
+        self._initialized = True
 
     def __str__(self) -> str:
         return_string: str = ''
-        for element in sorted(self.__children, key=lambda x: x.id):
+        for element in sorted(self._children, key=lambda x: x.id):
             if element.enabled:
                 if isinstance(element, GenericAttribute):
                     return_string += f'{element.id}: {element}\n'
@@ -144,28 +160,28 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
                     return_string += ''.join(['\t' + line for line in str(element).splitlines(True)])
         return return_string
 
-    def get_observer_entries(self, flags: Observable.ObserverEvent, on_transaction_end: bool = False, entries_sorted=True) \
+    def _collect_effective_observers(self, on_transaction_end: bool) \
             -> List[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]]:
         """
-        Retrieve a sorted list of observer entries based on the specified flags and transaction end condition.
+        Collect the entries of all observers that get notified for this object and its parents, sorted by priority.
 
         Args:
-            flags (Observable.ObserverEvent): The event flags to filter observers.
-            on_transaction_end (bool, optional): If True, only include observers that should be notified on transaction end. Defaults to False.
-            entries_sorted (bool, optional): If True, the list of observer entries will be sorted by priority. Defaults to True.
+            on_transaction_end (bool): If True, collect the observers that should be notified on transaction end.
 
         Returns:
-            List[Any]: A sorted list of observer entries that match the specified criteria.
-        """
-        observers: Set[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]] \
-            = set(super().get_observer_entries(flags, on_transaction_end, False))
-        if self.__parent is not None:
-            observers.update(self.__parent.get_observer_entries(flags=flags, on_transaction_end=on_transaction_end, entries_sorted=False))
-        if entries_sorted:
-            def get_priority(entry) -> int:
-                return int(entry[2])
-            return sorted(observers, key=get_priority)
-        return list(observers)
+            List[Any]: A sorted list of observer entries.
+        """
+        observers: List[Tuple[Callable, Observable.ObserverEvent, Observable.ObserverPriority, bool]] = \
+            super()._collect_effective_observers(on_transaction_end)
+        if self._parent is not None:
+            # The parent caches its effective observers, so this does not walk up the whole hierarchy
+            parent_observers = self._parent._get_effective_observers(on_transaction_end)  # pylint: disable=protected-access
+            if not observers:
+                return parent_observers
+            if parent_observers:
+                # Both lists are sorted, merging is cheaper than sorting. Observers registered on this object and a parent are only notified once
+                return list(dict.fromkeys(heapq.merge(observers, parent_observers, key=itemgetter(2))))
+        return observers
 
     def transaction_end(self) -> None:
         """
@@ -176,7 +192,7 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
         Returns:
             None
         """
-        for child in self.__children:
+        for child in self._children:
             child.transaction_end()
         super().transaction_end()
 
@@ -188,7 +204,7 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
         Returns:
             str: The identifier of the object.
         """
-        return self.__id
+        return self._id
 
     @property
     def parent(self) -> Optional[GenericObject]:
@@ -198,10 +214,10 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
         Returns:
             Optional[GenericObject]: The parent object if it exists, otherwise None.
         """
-        if self.__parent is not None and self not in self.__parent.children:
-            raise ValueError(f'Error in structure: Parent object {self.__parent.get_absolute_path()} does not have this attribute '
+        if self._parent is not None and not self._parent._has_child(self):  # pylint: disable=protected-access
+            raise ValueError(f'Error in structure: Parent object {self._parent.get_absolute_path()} does not have this attribute '
                              f'{self.get_absolute_path()} as a child')
-        return self.__parent
+        return self._parent
 
     @parent.setter
     def parent(self, parent: Optional[GenericObject]) -> None:
@@ -214,52 +230,196 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
         Returns:
             None
         """
-        if self.__parent is not None and self in self.__parent.children:
-            self.__parent.children.remove(self)
-        self.__parent = parent
+        if self._parent is not None and self._parent._has_child(self):  # pylint: disable=protected-access
+            self._parent._remove_child(self)  # pylint: disable=protected-access
+        self._parent = parent
         if parent is not None:
-            parent.children.append(self)
+            parent._add_child(self)  # pylint: disable=protected-access
+        self._invalidate_hierarchy_caches()
+        Observable.invalidate_observer_caches()
 
     @property
     def children(self) -> List[Union[GenericObject, GenericAttribute]]:
         """
         Returns the list of child objects.
 
+        The list must not be modified directly, children are added and removed by setting their parent.
+
         Returns:
             List[Union[GenericObject, GenericAttribute]]: A list containing child objects and attributes.
         """
-        return self.__children
+        return self._children
+
+    def _add_child(self, child: Union[GenericObject, GenericAttribute]) -> None:
+        """
+        Append a child to the list of children and register it in the index used for lookups by ID.
+
+        Args:
+            child (Union[GenericObject, GenericAttribute]): The child to add.
+
+        Returns:
+            None
+        """
+        with self._enabled_lock:
+            self._children.append(child)
+            if child.enabled:
+                self._child_enabled_changed(True)
+        self._children_by_id.setdefault(child.id, []).append(child)
+
+    def _remove_child(self, child: Union[GenericObject, GenericAttribute]) -> None:
+        """
+        Remove a child from the list of children and from the index used for lookups by ID.
+
+        Args:
+            child (Union[GenericObject, GenericAttribute]): The child to remove.
+
+        Returns:
+            None
+        """
+        with self._enabled_lock:
+            self._children.remove(child)
+            if child.enabled:
+                self._child_enabled_changed(False)
+        children_with_id: List[Union[GenericObject, GenericAttribute]] = self._children_by_id[child.id]
+        children_with_id.remove(child)
+        if not children_with_id:
+            del self._children_by_id[child.id]
+
+    def _child_enabled_changed(self, enabled: bool) -> None:
+        """
+        Update the number of enabled children when a child is enabled, disabled, added or removed.
+
+        Args:
+            enabled (bool): True if one more child is enabled, False if one less child is enabled.
+
+        Returns:
+            None
+        """
+        with self._enabled_lock:
+            if enabled:
+                self._enabled_children += 1
+            else:
+                self._enabled_children -= 1
+
+    def _set_child_enabled(self, child: GenericAttribute, enabled: bool) -> bool:
+        """
+        Set the enabled state of a child attribute and update the number of enabled children in one step.
+
+        Attributes have no lock for their enabled state, so the state is changed under the lock of the parent.
+        This way two threads enabling the same attribute cannot both count it.
+
+        Args:
+            child (GenericAttribute): The child attribute to change.
+            enabled (bool): The new enabled state of the child.
+
+        Returns:
+            bool: True if the enabled state of the child changed, False if it already had this state.
+        """
+        with self._enabled_lock:
+            if child._enabled == enabled:  # pylint: disable=protected-access
+                return False
+            child._enabled = enabled  # pylint: disable=protected-access
+            self._child_enabled_changed(enabled)
+            return True
+
+    def _has_enabled_children(self) -> bool:
+        """
+        Check if at least one child is enabled.
+
+        The counter of enabled children is trusted while it is positive. When it drops to zero the children are counted again,
+        so that a miscount can never disable an object that still has enabled children.
+
+        Returns:
+            bool: True if at least one child is enabled, False otherwise.
+        """
+        with self._enabled_lock:
+            if self._enabled_children > 0:
+                return True
+            self._enabled_children = sum(1 for child in self._children if child.enabled)
+            return self._enabled_children > 0
+
+    def _has_child(self, child: Union[GenericObject, GenericAttribute]) -> bool:
+        """
+        Check if the given object or attribute is a direct child.
+
+        Args:
+            child (Union[GenericObject, GenericAttribute]): The child to check.
+
+        Returns:
+            bool: True if the child is in the list of children, False otherwise.
+        """
+        return any(child_with_id is child for child_with_id in self._children_by_id.get(child.id, ()))
+
+    def _get_child(self, child_id: str) -> Optional[Union[GenericObject, GenericAttribute]]:
+        """
+        Retrieve a direct child by its ID.
+
+        Args:
+            child_id (str): The ID of the child.
+
+        Returns:
+            Optional[Union[GenericObject, GenericAttribute]]: The child with the given ID, or None if there is no such child.
+        """
+        children_with_id: Optional[List[Union[GenericObject, GenericAttribute]]] = self._children_by_id.get(child_id)
+        if children_with_id:
+            # The first child added with this ID wins, like the lookup by iterating the children did before
+            return children_with_id[0]
+        return None
 
     def get_root(self) -> GenericObject:
         """
-        Recursively finds and returns the root object in the hierarchy.
+        Finds and returns the root object in the hierarchy.
 
         This method traverses up the parent chain until it finds the top-most
         object (i.e., the object with no parent) and returns it.
+        The result is cached until the object or one of its ancestors is moved to a new parent.
 
         Returns:
             GenericObject: The root object in the hierarchy.
         """
-        if self.parent is None:
+        if self._parent is None:
             return self
-        return self.parent.get_root()
+        root: Optional[GenericObject] = self._root
+        if root is None:
+            root = self._parent
+            while root._parent is not None:  # pylint: disable=protected-access
+                root = root._parent  # pylint: disable=protected-access
+            self._root = root
+        return root
 
     def get_absolute_path(self) -> str:
         """
         Returns the absolute path of the current object as a string.
 
-        The absolute path is constructed by recursively calling the
-        `get_absolute_path` method on the parent object (if it exists)
-        and appending the current object's ID.
+        The absolute path is constructed by walking up the parent chain,
+        collecting the ID of every object on the way and joining them with '/'.
+        The result is cached until the object or one of its ancestors is moved to a new parent.
 
         Returns:
             str: The absolute path of the current object.
         """
-        address: str = ''
-        if self.__parent is not None:
-            address = f'{self.__parent.get_absolute_path()}/'
-        address += f'{self.__id}'
-        return address
+        if self._absolute_path is not None:
+            return self._absolute_path
+        parts: List[str] = []
+        node: Optional[GenericObject] = self
+        while node is not None:
+            parts.append(node._id)  # pylint: disable=protected-access
+            node = node._parent  # pylint: disable=protected-access
+        parts.reverse()
+        self._absolute_path = '/'.join(parts)
+        return self._absolute_path
+
+    def _invalidate_hierarchy_caches(self) -> None:
+        """
+        Drop the cached absolute path and root of this object and all of its descendants.
+
+        Returns:
+            None
+        """
+        self._absolute_path = None
+        self._root = None
+        for child in self._children:
+            child._invalidate_hierarchy_caches()  # pylint: disable=protected-access
 
     def get_attributes(self, recursive=False) -> List[GenericAttribute]:
         """
@@ -272,7 +432,7 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
             List[GenericAttribute]: A list of attributes found in the object's children.
         """
         attributes = []
-        for child in self.__children:
+        for child in self._children:
             if child.enabled:
                 # If the child is an attribute, add it to the list
                 if isinstance(child, GenericAttribute):
@@ -290,36 +450,40 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
         Returns:
             bool: True if the object is enabled, False otherwise.
         """
-        with self.__enabled_lock:
-            return self.__enabled
+        with self._enabled_lock:
+            return self._enabled
 
     # pylint: disable=duplicate-code
     @enabled.setter
     def enabled(self, set_enabled: bool) -> None:
-        with self.__enabled_lock:
+        with self._enabled_lock:
             if set_enabled:
-                # if the object is being enabled, we need to enable the parent first
-                if self.__parent is not None:
-                    self.__parent.enabled = True
+                # if the object is being enabled, we need to enable the parent first. The whole chain is walked, as an object that was moved
+                # to a new parent can be enabled while its new parents are not
+                if self._parent is not None:
+                    self._parent.enabled = True
                 # only notify if the object was not enabled before
-                if not self.__enabled:
-                    self.__enabled = True
+                if not self._enabled:
+                    self._enabled = True
+                    if self._parent is not None:
+                        self._parent._child_enabled_changed(True)  # pylint: disable=protected-access
                     self.notify(Observable.ObserverEvent.ENABLED)
             else:
                 # Propagate the disabled state down to the children first to have right order of notifications
-                for child in self.__children:
+                for child in self._children:
                     if child.enabled:
                         child.enabled = False
 
                 # only notify if the object was enabled before
-                if self.__enabled:
-                    self.__enabled = False
+                if self._enabled:
+                    self._enabled = False
+                    if self._parent is not None:
+                        self._parent._child_enabled_changed(False)  # pylint: disable=protected-access
                     self.notify(Observable.ObserverEvent.DISABLED)
 
                 # Disable parent only if all children are disabled
-                if self.__parent is not None and \
-                        all(not child.enabled for child in self.__parent.children):
-                    self.__parent.enabled = False
+                if self._parent is not None and not self._parent._has_enabled_children():  # pylint: disable=protected-access
+                    self._parent.enabled = False
     # pylint: enable=duplicate-code
 
     def get_by_path(self, address_string: str) -> Union[GenericObject, GenericAttribute, Literal[False]]:
@@ -335,27 +499,45 @@ class GenericObject(Observable):  # pylint: disable=too-many-instance-attributes
             Union[GenericObject, GenericAttribute, bool]: The object or attribute found at the specified path,
                                                           or False if no such object or attribute exists.
         """
-        # An empty string means we are looking for the current object
-        if address_string == '':
-            return self
-        # '..' means we are looking for the parent object
-        if address_string == '..' and self.parent is not None:
-            return self.parent
-
-        # If the address starts with a /, we have an absolute path and start from the root
-        if address_string.startswith('/'):
-            # Normalize the address_string by removing leading slashes
-            address_string = '/' + address_string.lstrip('/')
-            return self.get_root().get_by_path(address_string[1:])
+        # The path is split only once, the segments are then handed down the hierarchy
+        return self._get_by_segments(address_string.split('/'), 0)
+
+    def _get_by_segments(self, segments: List[str], index: int) -> Union[GenericObject, GenericAttribute, Literal[False]]:
+        """
+        Retrieve an object or attribute by the segments of its path.
+
+        Args:
+            segments (List[str]): The path split at '/'.
+            index (int): The index of the segment to resolve from this object, the segments before were already resolved.
+
+        Returns:
+            Union[GenericObject, GenericAttribute, bool]: The object or attribute found at the specified path,
+                                                          or False if no such object or attribute exists.
+        """
+        segment: str = segments[index]
+        is_last: bool = index == len(segments) - 1
+        if is_last:
+            # An empty rest of the path means we are looking for the current object
+            if segment == '':
+                return self
+            # '..' means we are looking for the parent object
+            if segment == '..' and self.parent is not None:
+                return self.parent
+        elif segment == '':
+            # If the rest of the path starts with a /, we have an absolute path and start from the root, ignoring repeated slashes
+            index += 1
+            while index < len(segments) - 1 and segments[index] == '':
+                index += 1
+            return self.get_root()._get_by_segments(segments, index)  # pylint: disable=protected-access
         # If the address is a relative path, we start from the current object
-        child_id, _, rest_of_path = address_string.partition('/')
-        for child in self.__children:
-            # If the child has the same ID as the first part of the address
-            if child.id == child_id:
-                # recursively search for the rest of the path
-                return child.get_by_path(rest_of_path)
-        # If we reach this point, we did not find the object
-        return False
+        child: Optional[Union[GenericObject, GenericAttribute]] = self._get_child(segment)
+        if child is None:
+            # If we reach this point, we did not find the object
+            return False
+        if is_last:
+            return child
+        # recursively search for the rest of the path
+        return child._get_by_segments(segments, index + 1)  # pylint: disable=protected-access
 
     def as_dict(self, filter_function: Optional[Callable[[Any], None]] = None, in_locale: Optional[str] = None) -> dict[Any, Any]:
         """
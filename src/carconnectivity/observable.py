@@ -8,36 +8,48 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import logging
+import itertools
 
 from enum import IntEnum, Flag, auto
 
 from carconnectivity.utils.timeout_lock import TimeoutLock
 
 if TYPE_CHECKING:
-    from typing import Optional, Set, Tuple, Callable, Any, List
+    from typing import Optional, Tuple, Callable, Any, List
 
 LOG: logging.Logger = logging.getLogger("carconnectivity")
 
+# Source for the generation numbers used to invalidate cached observer information, next() on it is atomic
+_OBSERVERS_GENERATIONS = itertools.count(1)
+
 
 class Observable:
     """
     A class to represent an observable object.
     """
+    __slots__ = ('__observers', '__observers_lock', 'flags_to_notify_on_transaction_end', '__delay_notifications', '__delayed_flags', '__effective_observers')
+
+    # Changes whenever observers are added or removed or the hierarchy changes, cached observer information of an older generation is stale
+    _observers_generation: int = 0
+
     def __init__(self, origin: Optional[Observable] = None) -> None:
         if origin is not None:
-            self.__observers: Set[Tuple[Callable[[Any, Observable.ObserverEvent], None],
-                                        Observable.ObserverEvent, Observable.ObserverPriority, bool]] = origin.__observers  # pylint: disable=protected-access
+            self.__observers: List[Tuple[Callable[[Any, Observable.ObserverEvent], None],
+                                         Observable.ObserverEvent, Observable.ObserverPriority, bool]] = origin.__observers  # pylint: disable=protected-access
             self.__observers_lock: TimeoutLock = origin.__observers_lock  # pylint: disable=protected-access
             self.flags_to_notify_on_transaction_end: Observable.ObserverEvent = origin.flags_to_notify_on_transaction_end
             self.__delay_notifications: bool = origin.__delay_notifications  # pylint: disable=protected-access
             self.__delayed_flags: Observable.ObserverEvent = origin.__delayed_flags  # pylint: disable=protected-access
         else:
-            self.__observers: Set[Tuple[Callable[[Any, Observable.ObserverEvent], None],
-                                        Observable.ObserverEvent, Observable.ObserverPriority, bool]] = set()
+            # Kept sorted by priority, so observers do not need to be sorted on every notification
+            self.__observers: List[Tuple[Callable[[Any, Observable.ObserverEvent], None],
+                                         Observable.ObserverEvent, Observable.ObserverPriority, bool]] = []
             self.__observers_lock: TimeoutLock = TimeoutLock(timeout=5.0)
             self.flags_to_notify_on_transaction_end: Observable.ObserverEvent = Observable.ObserverEvent.NONE
             self.__delay_notifications: bool = False
             self.__delayed_flags: Observable.ObserverEvent = Observable.ObserverEvent.NONE
+        # Cached observers of this object and its parents: (generation, immediate observers, transaction end observers, flags of immediate observers)
+        self.__effective_observers: Tuple[int, List[Any], List[Any], Observable.ObserverEvent] = (0, [], [], Observable.ObserverEvent.NONE)
 
     @property
     def delay_notifications(self) -> bool:
@@ -77,8 +89,16 @@ class Observable:
         with self.__observers_lock:
             if priority is None:
                 priority = Observable.ObserverPriority.USER_MID  # pyright: ignore[reportAssignmentType]
-            self.__observers.add((observer, flag, priority, on_transaction_end))
-            return True
+            observer_entry: Tuple[Callable[[Any, Observable.ObserverEvent], None], Observable.ObserverEvent, Observable.ObserverPriority, bool] = \
+                (observer, flag, priority, on_transaction_end)
+            if observer_entry not in self.__observers:
+                # Insert after all entries with the same or a higher priority to keep the list sorted
+                index: int = len(self.__observers)
+                while index > 0 and self.__observers[index - 1][2] > priority:
+                    index -= 1
+                self.__observers.insert(index, observer_entry)
+        Observable.invalidate_observer_caches()
+        return True
 
     def remove_observer(self, observer: Callable[[Any, Observable.ObserverEvent], None], flag: Optional[Observable.ObserverEvent] = None) -> bool:
         """
@@ -94,9 +114,77 @@ class Observable:
         """
         with self.__observers_lock:
             original_count = len(self.__observers)
-            self.__observers = set(filter(lambda observerEntry: observerEntry[0] == observer
-                                          or (flag is not None and observerEntry[1] == flag), self.__observers))  # pyright: ignore [reportAttributeAccessIssue]
-            return len(self.__observers) < original_count
+            self.__observers = list(filter(lambda observerEntry: observerEntry[0] == observer or (flag is not None and observerEntry[1] == flag),
+                                           self.__observers))  # pyright: ignore [reportAttributeAccessIssue]
+            removed: bool = len(self.__observers) < original_count
+        Observable.invalidate_observer_caches()
+        return removed
+
+    @staticmethod
+    def invalidate_observer_caches() -> None:
+        """
+        Invalidates all cached observer information.
+
+        Needs to be called whenever observers are added or removed or an object is moved to a new parent.
+
+        Returns:
+            None
+        """
+        Observable._observers_generation = next(_OBSERVERS_GENERATIONS)
+
+    def get_observed_flags(self) -> Observable.ObserverEvent:
+        """
+        Retrieve the flags any observer that is notified immediately (not on transaction end) is registered for.
+
+        The result is cached until observers are added or removed or the hierarchy changes.
+
+        Returns:
+            Observable.ObserverEvent: The combined flags of all observers.
+        """
+        return self.__update_effective_observers()[3]
+
+    def _get_effective_observers(self, on_transaction_end: bool = False) \
+            -> List[Tuple[Callable[[Any, Observable.ObserverEvent], None], Observable.ObserverEvent, Observable.ObserverPriority, bool]]:
+        """
+        Retrieve the entries of all observers that get notified for this object, sorted by priority.
+
+        The result is cached until observers are added or removed or the hierarchy changes. It must not be modified.
+
+        Args:
+            on_transaction_end (bool, optional): If True, return the observers that should be notified on transaction end. Defaults to False.
+
+        Returns:
+            List[Any]: A sorted list of observer entries.
+        """
+        effective_observers = self.__update_effective_observers()
+        return effective_observers[2] if on_transaction_end else effective_observers[1]
+
+    def __update_effective_observers(self) -> Tuple[int, List[Any], List[Any], Observable.ObserverEvent]:
+        generation: int = Observable._observers_generation
+        effective_observers = self.__effective_observers
+        if effective_observers[0] != generation:
+            observers = self._collect_effective_observers(on_transaction_end=False)
+            observed_flags: Observable.ObserverEvent = Observable.ObserverEvent.NONE
+            for observer_entry in observers:
+                observed_flags |= observer_entry[1]
+            effective_observers = (generation, observers, self._collect_effective_observers(on_transaction_end=True), observed_flags)
+            self.__effective_observers = effective_observers
+        return effective_observers
+
+    def _collect_effective_observers(self, on_transaction_end: bool) \
+            -> List[Tuple[Callable[[Any, Observable.ObserverEvent], None], Observable.ObserverEvent, Observable.ObserverPriority, bool]]:
+        """
+        Collect the entries of all observers that get notified for this object, sorted by priority.
+
+        Args:
+            on_transaction_end (bool): If True, collect the observers that should be notified on transaction end.
+
+        Returns:
+            List[Any]: A sorted list of observer entries.
+        """
+        # The observers are kept sorted by priority, so the filtered entries are sorted as well
+        with self.__observers_lock:
+            return [observer_entry for observer_entry in self.__observers if observer_entry[3] == on_transaction_end]
 
     def get_observers(self, flags, on_transaction_end: bool = False) -> List[Callable[[Any, Observable.ObserverEvent], None]]:
         """
@@ -125,19 +213,9 @@ class Observable:
         Returns:
             List[Any]: A sorted list of observer entries that match the specified criteria.
         """
-        with self.__observers_lock:
-            observers: Set[Tuple[Callable[[Any, Observable.ObserverEvent], None], Observable.ObserverEvent, Observable.ObserverPriority, bool]] = set()
-            for observer_entry in self.__observers:
-                observer, observerflags, priority, observer_on_transaction_complete = observer_entry
-                del observer
-                del priority
-                if (flags & observerflags) and observer_on_transaction_complete == on_transaction_end:
-                    observers.add(observer_entry)
-            if entries_sorted:
-                def get_priority(entry) -> int:
-                    return int(entry[2])
-                return sorted(observers, key=get_priority)
-            return list(observers)
+        # The effective observers are kept sorted by priority, so the filtered entries are always sorted
+        del entries_sorted
+        return [observer_entry for observer_entry in self._get_effective_observers(on_transaction_end) if flags & observer_entry[1]]
     # pylint: enable=duplicate-code
 
     def notify(self, flags: Observable.ObserverEvent) -> None:
@@ -155,14 +233,17 @@ class Observable:
         Returns:
             None
         """
-        #  Notify observers if delay is not enabled
+        if flags == Observable.ObserverEvent.NONE:
+            return
+        #  Notify observers if delay is not enabled, skip looking up the observers if nobody is interested in the flags
         if not self.delay_notifications:
-            observers: List[Callable[[Any, Observable.ObserverEvent], None]] = self.get_observers(flags=flags, on_transaction_end=False)
-            for observer in observers:
-                try:
-                    observer(element=self, flags=flags)
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    LOG.exception(e, stack_info=True)
+            if flags & self.get_observed_flags():
+                observers: List[Callable[[Any, Observable.ObserverEvent], None]] = self.get_observers(flags=flags, on_transaction_end=False)
+                for observer in observers:
+                    try:
+                        observer(element=self, flags=flags)
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        LOG.exception(e, stack_info=True)
         else:
             self.__delayed_flags |= flags
         # Remove disabled if was enabled and not yet notified, only last state to be reported
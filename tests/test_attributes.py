@@ -0,0 +1,22 @@
+"""Tests for the tags of GenericAttribute"""
+from carconnectivity.objects import GenericObject
+from carconnectivity.attributes import StringAttribute
+
+
+def test_tags_are_mutable_per_attribute():
+    """Changing the tags of one attribute does not change the tags of any other attribute"""
+    generic_object = GenericObject(object_id='object')
+    first = StringAttribute('first', parent=generic_object, tags={'carconnectivity'})
+    second = StringAttribute('second', parent=generic_object, tags={'carconnectivity'})
+    untagged = StringAttribute('untagged', parent=generic_object)
+    other_untagged = StringAttribute('other_untagged', parent=generic_object)
+
+    first.tags.add('first')
+    untagged.tags.add('untagged')
+    second.tag('second')
+    second.untag('carconnectivity')
+
+    assert first.tags == {'carconnectivity', 'first'}
+    assert second.tags == {'second'}
+    assert untagged.tags == {'untagged'}
+    assert other_untagged.tags == set()
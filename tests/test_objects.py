@@ -0,0 +1,120 @@
+"""Tests for the enabled state handling of GenericObject"""
+import threading
+
+from carconnectivity.objects import GenericObject
+from carconnectivity.attributes import StringAttribute
+
+
+def _create_object_with_attributes(count: int):
+    generic_object = GenericObject(object_id='object')
+    attributes = []
+    for index in range(count):
+        attribute = StringAttribute(f'a{index}', parent=generic_object)
+        attribute._set_value('value')  # pylint: disable=protected-access
+        attributes.append(attribute)
+    return generic_object, attributes
+
+
+def test_disable_last_child_disables_parent():
+    """Disabling the last enabled child disables the parent, disabling other children does not"""
+    generic_object, attributes = _create_object_with_attributes(3)
+    assert generic_object.enabled
+    for attribute in attributes[:-1]:
+        attribute.enabled = False
+        assert generic_object.enabled
+    attributes[-1].enabled = False
+    assert not generic_object.enabled
+
+
+def test_origin_takes_over_all_children():
+    """An object created from an origin takes over all children and counts all enabled ones"""
+    origin, attributes = _create_object_with_attributes(6)
+    new_object = GenericObject(origin=origin)
+    assert new_object.children == attributes
+    for attribute in attributes:
+        assert attribute.parent is new_object
+        assert attribute.enabled
+
+    # Disabling some of the children must keep the new object and the other children enabled
+    for attribute in attributes[::2]:
+        attribute.enabled = False
+    assert new_object.enabled
+    for attribute in attributes[1::2]:
+        assert attribute.enabled
+
+    for attribute in attributes[1::2]:
+        attribute.enabled = False
+    assert not new_object.enabled
+
+
+def test_miscounted_enabled_children_do_not_disable_parent():
+    """A counter of enabled children that is too low is corrected before the parent is disabled"""
+    generic_object, attributes = _create_object_with_attributes(3)
+    generic_object._enabled_children = 1  # pylint: disable=protected-access
+    attributes[0].enabled = False
+    assert generic_object.enabled
+    assert attributes[1].enabled and attributes[2].enabled
+
+
+def test_value_change_enables_new_parent():
+    """Changing the value of an attribute that was moved to a disabled parent enables the new parent"""
+    generic_object, attributes = _create_object_with_attributes(1)
+    other_object = GenericObject(object_id='other')
+    attributes[0].parent = other_object
+    assert not other_object.enabled
+    attributes[0]._set_value('other value')  # pylint: disable=protected-access
+    assert other_object.enabled
+    assert generic_object.children == []
+
+
+def test_clearing_disabled_attribute_disables_parent():
+    """Clearing the value of an already disabled attribute still disables a parent without enabled children"""
+    generic_object = GenericObject(object_id='object')
+    attribute = StringAttribute('attribute', parent=generic_object)
+    source = object()
+    attribute._set_value('value', source=source)  # pylint: disable=protected-access
+    attribute._disable_if_source(source)  # pylint: disable=protected-access
+    generic_object.enabled = True
+    attribute._set_value(None)  # pylint: disable=protected-access
+    assert not generic_object.enabled
+
+
+def test_enabling_walks_up_the_parents_of_a_moved_object():
+    """Enabling a child below a moved object enables all of its new parents, not only the direct one"""
+    root = GenericObject(object_id='root')
+    moved_object = GenericObject(object_id='moved', parent=root)
+    StringAttribute('first', parent=moved_object)._set_value('value')  # pylint: disable=protected-access
+    new_grandparent = GenericObject(object_id='grandparent', parent=root)
+    new_parent = GenericObject(object_id='parent', parent=new_grandparent)
+    moved_object.parent = new_parent
+    assert moved_object.enabled
+    assert not new_parent.enabled and not new_grandparent.enabled
+
+    StringAttribute('second', parent=moved_object)._set_value('value')  # pylint: disable=protected-access
+    assert new_parent.enabled
+    assert new_grandparent.enabled
+
+
+def _enable_concurrently(attribute: StringAttribute, thread_count: int) -> None:
+    barrier = threading.Barrier(thread_count)
+
+    def enable() -> None:
+        barrier.wait()
+        attribute.enabled = True
+
+    threads = [threading.Thread(target=enable) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrently_enabled_attribute_is_counted_once():
+    """Enabling the same attribute from several threads counts it only once, so disabling it disables the parent again"""
+    for _ in range(50):
+        generic_object = GenericObject(object_id='object')
+        attribute = StringAttribute('attribute', parent=generic_object)
+        _enable_concurrently(attribute, 8)
+        assert generic_object._enabled_children == 1  # pylint: disable=protected-access
+        attribute.enabled = False
+        assert not generic_object.enabled